@@ -0,0 +1,67 @@
+"""
+Import-time benchmark for the CLI entry point.
+
+Runs ``python -X importtime`` on ``football_simulator.cli`` and reports the
+slowest imports. Exits non-zero if an interactive-only dependency is imported
+eagerly or the total import time exceeds the budget.
+
+Usage:
+    python benchmarks/import_time.py [--budget-ms 150] [--runs 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+MODULE = "football_simulator.cli"
+# These must only be imported once the interactive menu or colour output is used
+INTERACTIVE_ONLY = ("questionary", "prompt_toolkit", "tqdm", "colorama")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure() -> Dict[str, Tuple[int, int]]:
+    """Import the CLI in a fresh interpreter and parse the importtime report."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-ms", type=float, default=150.0,
+                        help="maximum acceptable cumulative import time")
+    parser.add_argument("--runs", type=int, default=5, help="take the best of this many runs")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest imports to show")
+    args = parser.parse_args(argv)
+
+    runs = [measure() for _ in range(args.runs)]
+    best = min(runs, key=lambda t: t[MODULE][1])
+    total_ms = best[MODULE][1] / 1000
+
+    print(f"{MODULE}: {total_ms:.1f} ms cumulative (best of {args.runs})")
+    for name, (self_us, _) in sorted(best.items(), key=lambda kv: kv[1][0], reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:7.2f} ms  {name}")
+
+    eager = sorted({name.split(".")[0] for name in best} & set(INTERACTIVE_ONLY))
+    if eager:
+        print(f"FAIL: interactive dependencies imported eagerly: {', '.join(eager)}")
+        return 1
+    if total_ms > args.budget_ms:
+        print(f"FAIL: import time {total_ms:.1f} ms exceeds budget of {args.budget_ms:.0f} ms")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Scaling benchmark for large synthetic leagues.
+
+Builds leagues of increasing size on a lazy fixture schedule, simulates a few
+matchdays and reports time per matchday, time per match, leaderboard time and
+peak traced memory. Per-match cost should stay flat as the league grows.
+
+Usage:
+    python benchmarks/scaling.py [--teams 20,100,500,1000,2000] [--matchdays 3]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from football_simulator.models import League, create_team  # noqa: E402
+
+
+def run(n_teams: int, matchdays: int, history: str) -> dict:
+    """Simulate ``matchdays`` of an ``n_teams`` league and measure it."""
+    tracemalloc.start()
+    rng = random.Random(n_teams)
+    league = League("Scaling League", [create_team(f"Team{i}", rng) for i in range(n_teams)],
+                    history=history, seed=n_teams)
+    league.generate_fixtures(lazy=True)
+
+    start = time.perf_counter()
+    for _ in range(matchdays):
+        league.simulate_matchday()
+    simulate = time.perf_counter() - start
+
+    start = time.perf_counter()
+    league.get_league_table(limit=10)
+    league.get_top_scorers()
+    league.get_disciplinary_table()
+    leaderboards = time.perf_counter() - start
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    matches = matchdays * (n_teams // 2)
+    return {
+        'teams': n_teams,
+        'per_matchday_ms': simulate / matchdays * 1000,
+        'per_match_us': simulate / matches * 1e6,
+        'leaderboards_ms': leaderboards * 1000,
+        'peak_mb': peak / 2**20,
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--teams", default="20,100,500,1000,2000",
+                        help="comma-separated league sizes")
+    parser.add_argument("--matchdays", type=int, default=3, help="matchdays to simulate per size")
+    parser.add_argument("--history", choices=["full", "seed", "none"], default="none",
+                        help="how played matches are kept")
+    args = parser.parse_args(argv)
+
+    print(f"{'teams':>6} {'ms/matchday':>12} {'us/match':>9} {'top-k ms':>9} {'peak MB':>8}")
+    for n_teams in (int(n) for n in args.teams.split(",")):
+        result = run(n_teams, args.matchdays, args.history)
+        print(f"{result['teams']:6} {result['per_matchday_ms']:12.1f} {result['per_match_us']:9.1f} "
+              f"{result['leaderboards_ms']:9.2f} {result['peak_mb']:8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
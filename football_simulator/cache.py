@@ -0,0 +1,81 @@
+"""
+Memoized league views.
+
+Derived tables and rendered reports only change when a league's ``version``
+does, so they are cached per league and version. The cache holds a bounded
+number of leagues, least recently used first out, for processes that keep
+several leagues alive.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple, TypeVar, TYPE_CHECKING
+import threading
+
+if TYPE_CHECKING:
+    from .models import League
+
+T = TypeVar("T")
+
+
+class ViewCache:
+    """LRU of computed views, keyed by league token, league version and view key.
+
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_leagues: int = 8):
+        self.max_leagues = max_leagues
+        self.hits = 0
+        self.misses = 0
+        self._leagues: "OrderedDict[int, Tuple[int, Dict[Hashable, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, league: "League", key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Get a view of a league, computing it only if the league has changed.
+
+        Args:
+            league: The league the view is derived from
+            key: Identifies the view (e.g. its name and rendering options)
+            compute: Builds the view when it is not cached
+
+        Returns:
+            The cached or freshly computed view
+        """
+        version = league.version
+        with self._lock:
+            views = self._views(league.token, version)
+            if key in views:
+                self.hits += 1
+                return views[key]
+            self.misses += 1
+
+        value = compute()
+        with self._lock:
+            # Drop the result if the league changed while it was being computed
+            if league.version == version:
+                self._views(league.token, version)[key] = value
+        return value
+
+    def _views(self, token: int, version: int) -> Dict[Hashable, Any]:
+        """Get the views of a league at a version, discarding older ones (caller holds the lock)."""
+        entry = self._leagues.get(token)
+        if entry is None or entry[0] != version:
+            entry = self._leagues[token] = (version, {})
+        self._leagues.move_to_end(token)
+        while len(self._leagues) > self.max_leagues:
+            self._leagues.popitem(last=False)
+        return entry[1]
+
+    def invalidate(self, league: "League") -> None:
+        """Forget every cached view of a league."""
+        with self._lock:
+            self._leagues.pop(league.token, None)
+
+    def clear(self) -> None:
+        """Forget every cached view."""
+        with self._lock:
+            self._leagues.clear()
+
+
+# Shared cache; League invalidates its entries whenever it publishes a change
+VIEW_CACHE = ViewCache()
@@ -1,143 +1,94 @@
 """
 Command-line interface for the football simulator.
+
+Interactive dependencies (questionary, tqdm, colorama) are imported only when
+the interactive menu or coloured output is actually used, so batch runs start fast.
 """
 import sys
 import os
 from typing import List, Dict, Optional
+import argparse
 import random
-import questionary
-from colorama import init, Fore, Style
-from tqdm import tqdm
 import time
 
-from .models import League, Team, Player, Match, MatchStats
+from .models import League, Team, Match, MatchStats, create_team
+from .cache import VIEW_CACHE
 from .persistence import save_league, load_league, list_saves, get_latest_save
+from . import render
 
-# Initialize colorama
-init()
+# Leagues larger than this compute fixtures on demand instead of storing them
+LAZY_FIXTURES_ABOVE = 20
 
-def create_team(name: str) -> Team:
-    """Create a team with players."""
-    positions = ["GK"] + ["DEF"] * 4 + ["MID"] * 4 + ["FWD"] * 2
-    players = []
-    
-    # Create goalkeeper
-    gk = Player(f"{name}_GK1", name, "GK")
-    players.append(gk)
-    
-    # Create outfield players
-    for i, pos in enumerate(positions[1:], 1):
-        player = Player(f"{name}_P{i}", name, pos)
-        players.append(player)
-    
-    return Team(name, players)
+# Output settings, chosen in configure_output()
+_palette = render.PLAIN
+_verbosity = render.FULL
+
+
+def configure_output(color: Optional[bool] = None, verbosity: str = render.FULL) -> None:
+    """Choose coloured or plain output and how much detail to print per match."""
+    global _palette, _verbosity
+    _palette = render.palette_for(sys.stdout, color)
+    _verbosity = verbosity
+
+def parse_team_names(teams_input: str) -> List[str]:
+    """Split a comma-separated list of team names."""
+    return [name.strip() for name in teams_input.split(',') if name.strip()]
 
 def get_teams() -> List[Team]:
     """Get teams from user input."""
+    import questionary
+
     while True:
         teams_input = questionary.text(
-            "Enter team names (comma-separated, 2-20 teams):"
+            "Enter team names (comma-separated, at least 2 teams):"
         ).ask()
         
         if teams_input is None:  # User pressed Ctrl+C
             sys.exit(0)
             
-        team_names = [name.strip() for name in teams_input.split(',')]
-        if 2 <= len(team_names) <= 20:
+        team_names = parse_team_names(teams_input)
+        if len(team_names) >= 2:
             return [create_team(name) for name in team_names]
         
-        print("Please enter between 2 and 20 teams.")
+        print("Please enter at least 2 teams.")
 
 def display_match_stats(match: Match):
     """Display detailed match statistics."""
-    print(f"\n{Fore.CYAN}Match Statistics{Style.RESET_ALL}")
-    print(f"{'':20} {Fore.GREEN}HOME{Style.RESET_ALL}  {Fore.YELLOW}AWAY{Style.RESET_ALL}")
-    print("-" * 40)
-    
-    # Possession
-    print(f"{'Possession':20} {match.home_stats.possession:4.1f}%  {match.away_stats.possession:4.1f}%")
-    
-    # Shots
-    print(f"{'Shots':20} {match.home_stats.shots:4}  {match.away_stats.shots:4}")
-    print(f"{'Shots on Target':20} {match.home_stats.shots_on_target:4}  {match.away_stats.shots_on_target:4}")
-    
-    # Corners
-    print(f"{'Corners':20} {match.home_stats.corners:4}  {match.away_stats.corners:4}")
-    
-    # Passes
-    print(f"{'Passes':20} {match.home_stats.passes:4}  {match.away_stats.passes:4}")
-    print(f"{'Pass Accuracy':20} {match.home_stats.pass_accuracy:4.1f}%  {match.away_stats.pass_accuracy:4.1f}%")
-    
-    # Fouls and Cards
-    print(f"{'Fouls':20} {match.home_stats.fouls:4}  {match.away_stats.fouls:4}")
-    print(f"{'Yellow Cards':20} {match.home_stats.yellow_cards:4}  {match.away_stats.yellow_cards:4}")
-    print(f"{'Red Cards':20} {match.home_stats.red_cards:4}  {match.away_stats.red_cards:4}")
+    render.write(render.render_match_stats(match, _palette))
 
 def display_match_result(match: Match):
     """Display a match result with colors."""
-    print(f"\n{Fore.CYAN}Match Result:{Style.RESET_ALL}")
-    print(f"{Fore.GREEN}{match.home_team.name}{Style.RESET_ALL} {match.home_goals} - {match.away_goals} {Fore.YELLOW}{match.away_team.name}{Style.RESET_ALL}")
-    
-    if match.scorers:
-        print(f"\n{Fore.CYAN}Scorers:{Style.RESET_ALL}")
-        for scorer in match.scorers:
-            print(f"⚽ {scorer.name}")
-            
-    if match.assisters:
-        print(f"\n{Fore.CYAN}Assists:{Style.RESET_ALL}")
-        for assister in match.assisters:
-            print(f"👟 {assister.name}")
-            
-    # Display detailed match statistics
-    display_match_stats(match)
+    if _verbosity == render.SUMMARY:
+        render.write(render.render_match_summary(match))
+    else:
+        render.write(render.render_match_result(match, _palette))
+
+def display_matchday(matches: List[Match]):
+    """Display all results of a matchday in a single write."""
+    render.write(render.render_matchday(matches, _palette, _verbosity))
 
 def display_league_table(league: League):
     """Display the league table with colors."""
-    print(f"\n{Fore.CYAN}League Table{Style.RESET_ALL}")
-    print(f"{'Pos':4} {'Team':<20} {'P':>3} {'W':>3} {'D':>3} {'L':>3} {'GF':>3} {'GA':>3} {'GD':>4} {'Pts':>4}")
-    print("-" * 55)
-    
-    for pos, team in enumerate(league.get_league_table(), 1):
-        color = Fore.GREEN if pos <= 4 else Fore.RED if pos >= len(league.teams) - 2 else Style.RESET_ALL
-        print(f"{color}{pos:2}. {team.name:<20} {team.matches_played:3} {team.wins:3} {team.draws:3} "
-              f"{team.losses:3} {team.goals_for:3} {team.goals_against:3} {team.goal_difference:4} "
-              f"{team.points:4}{Style.RESET_ALL}")
+    render.write(VIEW_CACHE.get(league, ('table', _palette),
+                                lambda: render.render_league_table(league, _palette)))
 
 def display_stats(league: League):
     """Display various statistics."""
-    print(f"\n{Fore.CYAN}Top Scorers{Style.RESET_ALL}")
-    for pos, player in enumerate(league.get_top_scorers(), 1):
-        print(f"{pos}. {player.name:<20} {player.goals} goals")
-        
-    print(f"\n{Fore.CYAN}Top Assisters{Style.RESET_ALL}")
-    for pos, player in enumerate(league.get_top_assisters(), 1):
-        print(f"{pos}. {player.name:<20} {player.assists} assists")
-        
-    print(f"\n{Fore.CYAN}Clean Sheets{Style.RESET_ALL}")
-    for pos, player in enumerate(league.get_top_clean_sheets(), 1):
-        print(f"{pos}. {player.name:<20} {player.clean_sheets} clean sheets")
-        
-    print(f"\n{Fore.CYAN}Disciplinary Table{Style.RESET_ALL}")
-    for pos, player in enumerate(league.get_disciplinary_table(), 1):
-        print(f"{pos}. {player.name:<20} {player.yellow_cards}🟨 {player.red_cards}🟥")
-        
-    print(f"\n{Fore.CYAN}Pass Masters (min. 100 passes){Style.RESET_ALL}")
-    for pos, player in enumerate(league.get_pass_masters(), 1):
-        print(f"{pos}. {player.name:<20} {player.pass_accuracy:.1f}% ({player.passes_completed}/{player.passes})")
+    render.write(VIEW_CACHE.get(league, ('stats', _palette),
+                                lambda: render.render_stats(league, _palette)))
 
-def display_team_stats(team: Team):
-    """Display detailed statistics for a team."""
-    print(f"\n{Fore.CYAN}Team Statistics: {team.name}{Style.RESET_ALL}")
-    print(f"{'Average Possession':25} {team.average_possession:5.1f}%")
-    print(f"{'Shot Accuracy':25} {team.shot_accuracy:5.1f}%")
-    print(f"{'Pass Accuracy':25} {team.pass_accuracy:5.1f}%")
-    print(f"{'Clean Sheets':25} {team.clean_sheets}")
-    print(f"{'Yellow Cards':25} {team.yellow_cards}")
-    print(f"{'Red Cards':25} {team.red_cards}")
-    print(f"{'Total Fouls':25} {team.fouls}")
+def display_team_stats(team: Team, league: Optional[League] = None):
+    """Display detailed statistics for a team (cached until the league changes)."""
+    if league is None:
+        render.write(render.render_team_stats(team, _palette))
+        return
+    render.write(VIEW_CACHE.get(league, ('team', team.name, _palette),
+                                lambda: render.render_team_stats(team, _palette)))
 
 def load_or_new_league() -> League:
     """Prompt user to load a save or start a new league."""
+    import questionary
+
     saves = list_saves()
     
     if not saves:
@@ -159,7 +110,7 @@ def load_or_new_league() -> League:
         if not latest:
             print("No saves found. Starting a new league...")
             return League("Simulation League", get_teams())
-        return load_league(latest)
+        return load_league(latest, lazy=True)
     else:  # Choose Save File
         save_file = questionary.select(
             "Choose a save file:",
@@ -170,23 +121,26 @@ def load_or_new_league() -> League:
             sys.exit(0)
             
         chosen_save = next(s for s in saves if os.path.basename(s) == save_file)
-        return load_league(chosen_save)
+        return load_league(chosen_save, lazy=True)
 
 def simulate_season():
     """Main function to simulate a football season."""
-    print(f"{Fore.CYAN}Welcome to Football Match Simulator!{Style.RESET_ALL}")
+    import questionary
+    from tqdm import tqdm
+
+    print(f"{_palette.cyan}Welcome to Football Match Simulator!{_palette.reset}")
     
     # Load or create new league
     league = load_or_new_league()
     
     if not league.matches:  # New league
-        league.generate_fixtures()
+        league.generate_fixtures(lazy=len(league.teams) > LAZY_FIXTURES_ABOVE)
     
     total_matchdays = len(league.matches) // (len(league.teams) // 2)
     
     while True:
         if league.current_matchday >= total_matchdays:
-            print(f"\n{Fore.GREEN}Season completed!{Style.RESET_ALL}")
+            print(f"\n{_palette.green}Season completed!{_palette.reset}")
             break
             
         action = questionary.select(
@@ -205,15 +159,14 @@ def simulate_season():
             sys.exit(0)
         
         if action == 'Simulate next matchday':
-            print(f"\n{Fore.CYAN}Simulating Matchday {league.current_matchday + 1}{Style.RESET_ALL}")
+            print(f"\n{_palette.cyan}Simulating Matchday {league.current_matchday + 1}{_palette.reset}")
             matches = league.simulate_matchday()
             
             # Show progress bar
             for _ in tqdm(range(10), desc="Simulating matches", ncols=70):
                 time.sleep(0.1)
                 
-            for match in matches:
-                display_match_result(match)
+            display_matchday(matches)
                 
         elif action == 'View league table':
             display_league_table(league)
@@ -229,11 +182,11 @@ def simulate_season():
             
             if team_name:
                 selected_team = next(team for team in league.teams if team.name == team_name)
-                display_team_stats(selected_team)
+                display_team_stats(selected_team, league)
                 
         elif action == 'Save game':
             save_path = save_league(league)
-            print(f"\n{Fore.GREEN}Game saved to: {save_path}{Style.RESET_ALL}")
+            print(f"\n{_palette.green}Game saved to: {save_path}{_palette.reset}")
             
         else:  # Exit
             # Ask to save before exit if there are unsaved changes
@@ -245,7 +198,7 @@ def simulate_season():
                 
                 if should_save:
                     save_path = save_league(league)
-                    print(f"\n{Fore.GREEN}Game saved to: {save_path}{Style.RESET_ALL}")
+                    print(f"\n{_palette.green}Game saved to: {save_path}{_palette.reset}")
             sys.exit(0)
     
     # Show final standings and stats
@@ -260,13 +213,79 @@ def simulate_season():
     ).ask()
     
     if should_save:
-        save_path = save_league(league)
-        print(f"\n{Fore.GREEN}Season saved to: {save_path}{Style.RESET_ALL}")
+        save_path = save_league(league, compression='gzip')
+        print(f"\n{_palette.green}Season saved to: {save_path}{_palette.reset}")
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(prog="football-sim", description="Football league simulator")
+    color = parser.add_mutually_exclusive_group()
+    color.add_argument("--color", dest="color", action="store_true", default=None,
+                       help="always use coloured output")
+    color.add_argument("--no-color", dest="color", action="store_false",
+                       help="never use coloured output (default when stdout is not a terminal)")
+    batch = parser.add_argument_group("batch mode", "run without the interactive menu")
+    source = batch.add_mutually_exclusive_group()
+    source.add_argument("--load", metavar="PATH", help="load a save file")
+    source.add_argument("--latest", action="store_true", help="load the most recent save")
+    source.add_argument("--teams", metavar="NAMES", help="start a new league from comma-separated team names")
+    source.add_argument("--synthetic", type=int, metavar="N", help="start a new league of N generated teams")
+    batch.add_argument("--history", choices=["full", "seed", "none"], default="full",
+                       help="store full match output, only seeds to replay it from, "
+                            "or nothing (new leagues)")
+    batch.add_argument("--seed", type=int, help="random seed for a new league")
+    batch.add_argument("--matchdays", type=int, metavar="N",
+                       help="number of matchdays to simulate (default: rest of the season)")
+    batch.add_argument("--save", action="store_true", help="save the league afterwards")
+    batch.add_argument("--compress", choices=["gzip", "xz"], help="compress the save")
+    parser.add_argument("--summary", dest="verbosity", action="store_const",
+                        const=render.SUMMARY, default=render.FULL,
+                        help="print one line per match instead of full match reports")
+    return parser.parse_args(argv)
+
+def run_batch(args: argparse.Namespace) -> None:
+    """Load or create a league and simulate it without any prompts."""
+    if args.teams or args.synthetic is not None:
+        team_names = (parse_team_names(args.teams) if args.teams
+                      else [f"Team{i + 1}" for i in range(args.synthetic)])
+        if len(team_names) < 2:
+            sys.exit("Please enter at least 2 teams.")
+        rng = random.Random(args.seed) if args.seed is not None else None
+        league = League("Simulation League", [create_team(name, rng) for name in team_names],
+                        history=args.history, seed=args.seed)
+    else:
+        path = args.load or get_latest_save()
+        if not path:
+            sys.exit("No saved leagues found.")
+        league = load_league(path, lazy=True)
+
+    if not league.matches:
+        league.generate_fixtures(lazy=len(league.teams) > LAZY_FIXTURES_ABOVE)
+
+    remaining = args.matchdays
+    while remaining is None or remaining > 0:
+        matches = league.simulate_matchday()
+        if not matches:
+            break
+        print(f"\n{_palette.cyan}Matchday {league.current_matchday}{_palette.reset}")
+        display_matchday(matches)
+        if remaining is not None:
+            remaining -= 1
+
+    display_league_table(league)
+    if args.save:
+        save_path = save_league(league, compression=args.compress)
+        print(f"\n{_palette.green}Game saved to: {save_path}{_palette.reset}")
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Entry point for the CLI."""
+    args = parse_args(argv)
+    configure_output(args.color, args.verbosity)
     try:
-        simulate_season()
+        if args.load or args.latest or args.teams or args.synthetic is not None:
+            run_batch(args)
+        else:
+            simulate_season()
     except KeyboardInterrupt:
         print("\nExiting...")
         sys.exit(0)
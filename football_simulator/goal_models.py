@@ -0,0 +1,182 @@
+"""
+Goal models for match simulation.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Iterable, Tuple, TYPE_CHECKING
+import bisect
+import math
+import random
+
+if TYPE_CHECKING:
+    from .models import Team
+
+# Team rating that corresponds to average attack and defence strength
+REFERENCE_RATING = 75.0
+# How strongly rating differences translate into goal rate differences
+RATING_EXPONENT = 2.0
+
+
+def strengths_from_rating(rating: float) -> Tuple[float, float]:
+    """Derive (attack, defence) multipliers from a team rating.
+
+    Attack above 1.0 scores more than average, defence above 1.0 concedes more.
+    """
+    ratio = (rating / REFERENCE_RATING) ** RATING_EXPONENT
+    return ratio, 1 / ratio
+
+
+def rating_from_strengths(attack: float, defence: float) -> float:
+    """Inverse of :func:`strengths_from_rating` for fitted strengths."""
+    return REFERENCE_RATING * (attack / defence) ** (1 / (2 * RATING_EXPONENT))
+
+
+def team_strengths(team: "Team") -> Tuple[float, float]:
+    """Get a team's (attack, defence) strengths, falling back to its rating."""
+    if team.attack is not None and team.defence is not None:
+        return team.attack, team.defence
+    return strengths_from_rating(team.team_rating)
+
+
+def _poisson_pmf(rate: float, max_goals: int) -> list:
+    """Poisson probabilities for 0..max_goals goals."""
+    probs = [math.exp(-rate)]
+    for k in range(1, max_goals + 1):
+        probs.append(probs[-1] * rate / k)
+    return probs
+
+
+@dataclass(frozen=True)
+class ScoreTable:
+    """Precomputed score probabilities for one pair of goal rates."""
+    home_rate: float
+    away_rate: float
+    probabilities: Tuple[Tuple[float, ...], ...]
+    cumulative: Tuple[float, ...]
+    home_win: float
+    draw: float
+    away_win: float
+
+    def probability(self, home_goals: int, away_goals: int) -> float:
+        """Probability of an exact scoreline (0.0 beyond the table)."""
+        size = len(self.probabilities)
+        if not (0 <= home_goals < size and 0 <= away_goals < size):
+            return 0.0
+        return self.probabilities[home_goals][away_goals]
+
+    def sample(self, rng=random) -> Tuple[int, int]:
+        """Draw a scoreline with a single random number."""
+        idx = bisect.bisect_right(self.cumulative, rng.random())
+        return divmod(min(idx, len(self.cumulative) - 1), len(self.probabilities))
+
+
+@dataclass
+class PoissonGoalModel:
+    """Independent Poisson goal model with optional Dixon-Coles correction.
+
+    Goal rates are ``home_goal_rate * home_attack * away_defence`` and
+    ``away_goal_rate * away_attack * home_defence``. A negative ``rho`` applies
+    the Dixon-Coles adjustment, which makes low-scoring draws more likely.
+    """
+    home_goal_rate: float = 1.5
+    away_goal_rate: float = 1.15
+    rho: float = 0.0
+    max_goals: int = 10
+    cache_size: int = 4096
+    _tables: "OrderedDict[Tuple[float, float], ScoreTable]" = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+
+    def expected_goals(self, home_team: "Team", away_team: "Team") -> Tuple[float, float]:
+        """Get the (home, away) goal rates for a fixture."""
+        home_attack, home_defence = team_strengths(home_team)
+        away_attack, away_defence = team_strengths(away_team)
+        return (
+            self.home_goal_rate * home_attack * away_defence,
+            self.away_goal_rate * away_attack * home_defence,
+        )
+
+    def _tau(self, home_goals: int, away_goals: int, home_rate: float, away_rate: float) -> float:
+        """Dixon-Coles dependence factor for low scores."""
+        if home_goals == 0 and away_goals == 0:
+            return 1 - home_rate * away_rate * self.rho
+        if home_goals == 0 and away_goals == 1:
+            return 1 + home_rate * self.rho
+        if home_goals == 1 and away_goals == 0:
+            return 1 + away_rate * self.rho
+        if home_goals == 1 and away_goals == 1:
+            return 1 - self.rho
+        return 1.0
+
+    def _build_table(self, home_rate: float, away_rate: float) -> ScoreTable:
+        """Compute the truncated and normalised score matrix."""
+        home_probs = _poisson_pmf(home_rate, self.max_goals)
+        away_probs = _poisson_pmf(away_rate, self.max_goals)
+        rows = []
+        for h, ph in enumerate(home_probs):
+            row = []
+            for a, pa in enumerate(away_probs):
+                p = ph * pa
+                if self.rho and h <= 1 and a <= 1:
+                    p *= max(0.0, self._tau(h, a, home_rate, away_rate))
+                row.append(p)
+            rows.append(row)
+
+        total = sum(map(sum, rows))
+        probabilities = tuple(tuple(p / total for p in row) for row in rows)
+
+        cumulative = []
+        running = 0.0
+        home_win = draw = away_win = 0.0
+        for h, row in enumerate(probabilities):
+            for a, p in enumerate(row):
+                running += p
+                cumulative.append(running)
+                if h > a:
+                    home_win += p
+                elif h == a:
+                    draw += p
+                else:
+                    away_win += p
+
+        return ScoreTable(home_rate, away_rate, probabilities, tuple(cumulative),
+                          home_win, draw, away_win)
+
+    def table_for_rates(self, home_rate: float, away_rate: float) -> ScoreTable:
+        """Get the (cached) score table for a pair of goal rates."""
+        key = (home_rate, away_rate)
+        table = self._tables.get(key)
+        if table is not None:
+            self._tables.move_to_end(key)
+            return table
+
+        table = self._build_table(home_rate, away_rate)
+        self._tables[key] = table
+        if len(self._tables) > self.cache_size:
+            self._tables.popitem(last=False)
+        return table
+
+    def score_table(self, home_team: "Team", away_team: "Team") -> ScoreTable:
+        """Get the score table for a fixture."""
+        return self.table_for_rates(*self.expected_goals(home_team, away_team))
+
+    def outcome_probabilities(self, home_team: "Team", away_team: "Team") -> Tuple[float, float, float]:
+        """Get exact (home win, draw, away win) probabilities without simulating."""
+        table = self.score_table(home_team, away_team)
+        return table.home_win, table.draw, table.away_win
+
+    def sample(self, home_team: "Team", away_team: "Team", rng=random) -> Tuple[int, int]:
+        """Sample a (home goals, away goals) scoreline for a fixture."""
+        return self.score_table(home_team, away_team).sample(rng)
+
+    def precompute(self, teams: Iterable["Team"]) -> None:
+        """Build score tables for every ordered pair of teams up front."""
+        teams = list(teams)
+        for home in teams:
+            for away in teams:
+                if home is not away:
+                    self.score_table(home, away)
+
+    def clear_cache(self) -> None:
+        """Drop all cached score tables (e.g. after team strengths change)."""
+        self._tables.clear()
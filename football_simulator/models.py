@@ -1,10 +1,20 @@
 """
 Core models for the football simulator.
 """
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from collections.abc import MutableSequence
+from dataclasses import dataclass, field, astuple, replace
+from typing import Any, Callable, Iterator, List, Dict, Optional, Tuple
+import copy
+import hashlib
+import heapq
 import random
 import itertools
+import threading
+
+from .cache import VIEW_CACHE
+from .goal_models import PoissonGoalModel, rating_from_strengths
+from .projection import TeamProjection, project_league
+from .ratings import RatingModel
 
 
 @dataclass
@@ -95,6 +105,8 @@ class Team:
     red_cards: int = 0
     fouls: int = 0
     possession_total: float = 0.0
+    attack: Optional[float] = None
+    defence: Optional[float] = None
 
     @property
     def goal_difference(self) -> int:
@@ -106,6 +118,8 @@ class Team:
 
     @property
     def team_rating(self) -> float:
+        if self.attack is not None and self.defence is not None:
+            return rating_from_strengths(self.attack, self.defence)
         if not self.players:
             return 70.0
         return sum(p.rating * p.form for p in self.players) / len(self.players)
@@ -135,6 +149,59 @@ class Team:
         return f"{self.name} ({self.points} pts)"
 
 
+def create_team(name: str, rng: Optional[random.Random] = None) -> Team:
+    """Create a team with players (ratings and form drawn from ``rng`` if given)."""
+    positions = ["GK"] + ["DEF"] * 4 + ["MID"] * 4 + ["FWD"] * 2
+    players = []
+    for i, pos in enumerate(positions):
+        player_name = f"{name}_GK1" if i == 0 else f"{name}_P{i}"
+        if rng is None:
+            players.append(Player(player_name, name, pos))
+        else:
+            players.append(Player(player_name, name, pos, rng.uniform(60, 90),
+                                  form=rng.uniform(0.8, 1.2)))
+    return Team(name, players)
+
+
+@dataclass(frozen=True)
+class SimulationParams:
+    """Tunable constants of the match engine (defaults reproduce the original model)."""
+    # Possession: 50% plus this much per rating point of difference, clamped
+    possession_per_rating: float = 0.5
+    min_possession: float = 30.0
+    max_possession: float = 70.0
+    # Shots at 50% possession, and spread
+    home_shots: float = 12.0
+    away_shots: float = 10.0
+    shots_sd: float = 3.0
+    # Fraction of shots on target (uniform range)
+    home_on_target: Tuple[float, float] = (0.3, 0.6)
+    away_on_target: Tuple[float, float] = (0.25, 0.55)
+    # Goals per shot on target, and spread
+    home_conversion: float = 0.3
+    away_conversion: float = 0.25
+    goals_sd: float = 1.0
+    # Corners and fouls: (mean, sd)
+    home_corners: Tuple[float, float] = (6.0, 2.0)
+    away_corners: Tuple[float, float] = (5.0, 2.0)
+    home_fouls: Tuple[float, float] = (10.0, 3.0)
+    away_fouls: Tuple[float, float] = (11.0, 3.0)
+    # Yellow cards per foul, capped; chance of a red card
+    home_yellow_rate: float = 0.3
+    away_yellow_rate: float = 0.35
+    max_yellow_cards: int = 5
+    home_red_chance: float = 0.05
+    away_red_chance: float = 0.06
+    # Passes per possession percentage point, and completion (uniform range)
+    passes_per_possession: float = 5.0
+    home_pass_completion: Tuple[float, float] = (0.75, 0.9)
+    away_pass_completion: Tuple[float, float] = (0.7, 0.85)
+    assist_chance: float = 0.8
+
+
+DEFAULT_PARAMS = SimulationParams()
+
+
 @dataclass
 class Match:
     home_team: Team
@@ -147,20 +214,29 @@ class Match:
     away_stats: MatchStats = field(default_factory=MatchStats)
     completed: bool = False
 
-    def simulate(self) -> None:
-        """Simulate the match result based on team ratings and form."""
+    def simulate(self, goal_model: Optional[PoissonGoalModel] = None,
+                 score: Optional[Tuple[int, int]] = None,
+                 rng: Optional[random.Random] = None,
+                 params: Optional[SimulationParams] = None) -> None:
+        """Simulate the match result based on team ratings and form.
+
+        If a goal model is given, the score is drawn from its precomputed
+        score table instead of being derived from shots on target. A fixed
+        ``score`` overrides both; the rest of the match is still simulated.
+        Passing a seeded ``rng`` makes the result reproducible, and ``params``
+        overrides the engine's constants.
+        """
         if self.completed:
             return
-
-        # Calculate expected goals based on team ratings
-        home_xg = self.home_team.team_rating / 20
-        away_xg = self.away_team.team_rating / 25  # Away teams score less
+        rng = rng or random
+        params = params or DEFAULT_PARAMS
 
         # Simulate possession
         base_possession = 50
         rating_diff = self.home_team.team_rating - self.away_team.team_rating
-        possession_modifier = rating_diff / 2
-        self.home_stats.possession = min(70, max(30, base_possession + possession_modifier))
+        possession_modifier = rating_diff * params.possession_per_rating
+        self.home_stats.possession = min(params.max_possession,
+                                         max(params.min_possession, base_possession + possession_modifier))
         self.away_stats.possession = 100 - self.home_stats.possession
 
         # Update team possession totals
@@ -168,11 +244,25 @@ class Match:
         self.away_team.possession_total += self.away_stats.possession
 
         # Simulate shots and shots on target
-        self.home_stats.shots = max(0, int(random.gauss(12 * (self.home_stats.possession/50), 3)))
-        self.away_stats.shots = max(0, int(random.gauss(10 * (self.away_stats.possession/50), 3)))
+        self.home_stats.shots = max(0, int(rng.gauss(params.home_shots * (self.home_stats.possession/50), params.shots_sd)))
+        self.away_stats.shots = max(0, int(rng.gauss(params.away_shots * (self.away_stats.possession/50), params.shots_sd)))
         
-        self.home_stats.shots_on_target = max(0, int(self.home_stats.shots * random.uniform(0.3, 0.6)))
-        self.away_stats.shots_on_target = max(0, int(self.away_stats.shots * random.uniform(0.25, 0.55)))
+        self.home_stats.shots_on_target = max(0, int(self.home_stats.shots * rng.uniform(*params.home_on_target)))
+        self.away_stats.shots_on_target = max(0, int(self.away_stats.shots * rng.uniform(*params.away_on_target)))
+
+        if score is None and goal_model is None:
+            # Simulate goals based on shots on target
+            self.home_goals = max(0, int(rng.gauss(self.home_stats.shots_on_target * params.home_conversion, params.goals_sd)))
+            self.away_goals = max(0, int(rng.gauss(self.away_stats.shots_on_target * params.away_conversion, params.goals_sd)))
+        else:
+            if score is not None:
+                self.home_goals, self.away_goals = score
+            else:
+                self.home_goals, self.away_goals = goal_model.sample(self.home_team, self.away_team, rng)
+            # Every goal needs a shot on target
+            for stats, goals in ((self.home_stats, self.home_goals), (self.away_stats, self.away_goals)):
+                stats.shots_on_target = max(stats.shots_on_target, goals)
+                stats.shots = max(stats.shots, stats.shots_on_target)
 
         # Update team shot totals
         self.home_team.total_shots += self.home_stats.shots
@@ -180,12 +270,8 @@ class Match:
         self.away_team.total_shots += self.away_stats.shots
         self.away_team.shots_on_target += self.away_stats.shots_on_target
 
-        # Simulate goals based on shots on target
-        self.home_goals = max(0, int(random.gauss(self.home_stats.shots_on_target * 0.3, 1)))
-        self.away_goals = max(0, int(random.gauss(self.away_stats.shots_on_target * 0.25, 1)))
-
         # Simulate other match events
-        self._simulate_match_events()
+        self._simulate_match_events(rng, params)
 
         # Update team stats
         self.home_team.goals_for += self.home_goals
@@ -208,24 +294,24 @@ class Match:
             self.away_team.draws += 1
 
         # Simulate goal scorers and assists
-        self._simulate_goals()
+        self._simulate_goals(rng, params)
         self.completed = True
 
-    def _simulate_match_events(self) -> None:
+    def _simulate_match_events(self, rng: random.Random, params: SimulationParams) -> None:
         """Simulate various match events like cards, corners, etc."""
         # Simulate corners
-        self.home_stats.corners = max(0, int(random.gauss(6, 2)))
-        self.away_stats.corners = max(0, int(random.gauss(5, 2)))
+        self.home_stats.corners = max(0, int(rng.gauss(*params.home_corners)))
+        self.away_stats.corners = max(0, int(rng.gauss(*params.away_corners)))
 
         # Simulate fouls and cards
-        self.home_stats.fouls = max(0, int(random.gauss(10, 3)))
-        self.away_stats.fouls = max(0, int(random.gauss(11, 3)))  # Away teams slightly more fouls
+        self.home_stats.fouls = max(0, int(rng.gauss(*params.home_fouls)))
+        self.away_stats.fouls = max(0, int(rng.gauss(*params.away_fouls)))  # Away teams slightly more fouls
 
-        self.home_stats.yellow_cards = min(5, max(0, int(self.home_stats.fouls * 0.3)))
-        self.away_stats.yellow_cards = min(5, max(0, int(self.away_stats.fouls * 0.35)))
+        self.home_stats.yellow_cards = min(params.max_yellow_cards, max(0, int(self.home_stats.fouls * params.home_yellow_rate)))
+        self.away_stats.yellow_cards = min(params.max_yellow_cards, max(0, int(self.away_stats.fouls * params.away_yellow_rate)))
 
-        self.home_stats.red_cards = 1 if random.random() < 0.05 else 0  # 5% chance
-        self.away_stats.red_cards = 1 if random.random() < 0.06 else 0  # 6% chance for away team
+        self.home_stats.red_cards = 1 if rng.random() < params.home_red_chance else 0
+        self.away_stats.red_cards = 1 if rng.random() < params.away_red_chance else 0
 
         # Update team stats
         self.home_team.yellow_cards += self.home_stats.yellow_cards
@@ -236,11 +322,11 @@ class Match:
         self.away_team.fouls += self.away_stats.fouls
 
         # Simulate passes
-        self.home_stats.passes = int(self.home_stats.possession * 5)  # Rough estimate
-        self.away_stats.passes = int(self.away_stats.possession * 5)
+        self.home_stats.passes = int(self.home_stats.possession * params.passes_per_possession)  # Rough estimate
+        self.away_stats.passes = int(self.away_stats.possession * params.passes_per_possession)
 
-        self.home_stats.passes_completed = int(self.home_stats.passes * random.uniform(0.75, 0.9))
-        self.away_stats.passes_completed = int(self.away_stats.passes * random.uniform(0.7, 0.85))
+        self.home_stats.passes_completed = int(self.home_stats.passes * rng.uniform(*params.home_pass_completion))
+        self.away_stats.passes_completed = int(self.away_stats.passes * rng.uniform(*params.away_pass_completion))
 
         # Update team pass totals
         self.home_team.total_passes += self.home_stats.passes
@@ -248,27 +334,27 @@ class Match:
         self.away_team.total_passes += self.away_stats.passes
         self.away_team.passes_completed += self.away_stats.passes_completed
 
-    def _simulate_goals(self) -> None:
+    def _simulate_goals(self, rng: random.Random, params: SimulationParams) -> None:
         """Simulate who scored the goals and made the assists."""
         for _ in range(self.home_goals):
-            scorer = random.choice([p for p in self.home_team.players if p.position != "GK"])
+            scorer = rng.choice([p for p in self.home_team.players if p.position != "GK"])
             scorer.goals += 1
             scorer.shots += 1
             scorer.shots_on_target += 1
             self.scorers.append(scorer)
-            if random.random() < 0.8:  # 80% chance of assist
-                assister = random.choice([p for p in self.home_team.players if p != scorer])
+            if rng.random() < params.assist_chance:
+                assister = rng.choice([p for p in self.home_team.players if p != scorer])
                 assister.assists += 1
                 self.assisters.append(assister)
 
         for _ in range(self.away_goals):
-            scorer = random.choice([p for p in self.away_team.players if p.position != "GK"])
+            scorer = rng.choice([p for p in self.away_team.players if p.position != "GK"])
             scorer.goals += 1
             scorer.shots += 1
             scorer.shots_on_target += 1
             self.scorers.append(scorer)
-            if random.random() < 0.8:  # 80% chance of assist
-                assister = random.choice([p for p in self.away_team.players if p != scorer])
+            if rng.random() < params.assist_chance:
+                assister = rng.choice([p for p in self.away_team.players if p != scorer])
                 assister.assists += 1
                 self.assisters.append(assister)
 
@@ -284,20 +370,343 @@ class Match:
                 if p.position == "GK":
                     p.clean_sheets += 1
 
+    def result_digest(self) -> str:
+        """Fingerprint of the full match outcome, used to verify replays."""
+        outcome = (
+            self.home_goals, self.away_goals,
+            astuple(self.home_stats), astuple(self.away_stats),
+            [p.name for p in self.scorers], [p.name for p in self.assisters],
+        )
+        return hashlib.blake2b(repr(outcome).encode(), digest_size=8).hexdigest()
+
     def __str__(self) -> str:
         status = "✓" if self.completed else "⏳"
         return f"{status} {self.home_team.name} {self.home_goals} - {self.away_goals} {self.away_team.name}"
 
 
+def _shell_team(team: Team, strengths: Optional[Tuple[float, float]]) -> Team:
+    """Fresh copy of a team's roster with all counters at zero."""
+    players = [Player(p.name, p.team, p.position, p.rating, form=p.form) for p in team.players]
+    attack, defence = strengths if strengths is not None else (None, None)
+    return Team(team.name, players, attack=attack, defence=defence)
+
+
+@dataclass(frozen=True)
+class MatchRecord:
+    """Compact inputs from which a completed match can be re-simulated exactly."""
+    home_team: str
+    away_team: str
+    seed: int
+    home_rating: float
+    away_rating: float
+    digest: str
+    home_strengths: Optional[Tuple[float, float]] = None
+    away_strengths: Optional[Tuple[float, float]] = None
+    score: Optional[Tuple[int, int]] = None
+    # Base (home, away) goal rates of the goal model, which a rating model may refit
+    goal_rates: Optional[Tuple[float, float]] = None
+
+    @staticmethod
+    def strengths_of(team: Team) -> Optional[Tuple[float, float]]:
+        """Fitted (attack, defence) of a team, if it has any."""
+        if team.attack is None or team.defence is None:
+            return None
+        return team.attack, team.defence
+
+    def replay(self, home_team: Team, away_team: Team,
+               goal_model: Optional[PoissonGoalModel] = None,
+               params: Optional[SimulationParams] = None) -> Match:
+        """
+        Re-simulate the match on fresh copies of the two rosters.
+
+        Args:
+            home_team: Current home team (only its roster is used)
+            away_team: Current away team (only its roster is used)
+            goal_model: The goal model the league used when the match was played
+            params: The engine parameters the league used
+
+        Returns:
+            A completed Match identical to the original
+
+        Raises:
+            ValueError: If the inputs or the regenerated result do not match the record
+        """
+        home = _shell_team(home_team, self.home_strengths)
+        away = _shell_team(away_team, self.away_strengths)
+        if home.team_rating != self.home_rating or away.team_rating != self.away_rating:
+            raise ValueError(f"Cannot replay {self.home_team} v {self.away_team}: team ratings have changed")
+        if goal_model is not None and self.goal_rates is not None and \
+                (goal_model.home_goal_rate, goal_model.away_goal_rate) != self.goal_rates:
+            goal_model = replace(goal_model, home_goal_rate=self.goal_rates[0],
+                                 away_goal_rate=self.goal_rates[1])
+
+        match = Match(home, away)
+        match.simulate(goal_model, self.score, random.Random(self.seed), params)
+        if match.result_digest() != self.digest:
+            raise ValueError(f"Replay of {self.home_team} v {self.away_team} does not match the recorded result")
+        return match
+
+
+class LazyMatchList(MutableSequence):
+    """A list of matches that builds each Match from its raw entry on first access.
+
+    Matches replayed from a :class:`MatchRecord` are rebuilt on every access
+    rather than cached, so seed-only history stays compact.
+    """
+
+    def __init__(self, entries: List[Any], hydrate: Callable[[Any], Match]):
+        self._entries = list(entries)
+        self._hydrate = hydrate
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        entry = self._entries[index]
+        if isinstance(entry, Match):
+            return entry
+        match = self._hydrate(entry)
+        if not isinstance(entry, MatchRecord):
+            self._entries[index] = match
+        return match
+
+    def __setitem__(self, index, value) -> None:
+        self._entries[index] = value
+
+    def __delitem__(self, index) -> None:
+        del self._entries[index]
+
+    def insert(self, index: int, value: Match) -> None:
+        self._entries.insert(index, value)
+
+    def is_hydrated(self, index: int) -> bool:
+        """Check whether the match at an index has been built yet."""
+        return isinstance(self._entries[index], Match)
+
+    def entries(self) -> List[Any]:
+        """Get the underlying entries without hydrating them."""
+        return list(self._entries)
+
+    def copy(self, hydrate: Optional[Callable[[Any], Match]] = None) -> "LazyMatchList":
+        """Shallow copy that shares unhydrated entries, optionally hydrating them differently."""
+        return LazyMatchList(self._entries, hydrate or self._hydrate)
+
+
+class FixtureSchedule(MutableSequence):
+    """A double round-robin fixture list computed on demand instead of stored.
+
+    Fixtures are produced with the circle method, so every team plays at most
+    once per matchday, and only matches that have been stored back (played or
+    replaced) take up memory.
+    """
+
+    def __init__(self, teams: List[Team], order: Optional[List[int]] = None,
+                 played: Optional[Dict[int, Any]] = None,
+                 hydrate: Optional[Callable[[Any], Match]] = None):
+        self._teams = teams
+        self.order = list(order) if order is not None else list(range(len(teams)))
+        self._played = dict(played or {})
+        self._hydrate = hydrate
+        self._slots = len(self.order) + len(self.order) % 2  # including a bye
+        self.per_day = len(self.order) // 2
+
+    def pairing(self, index: int) -> Tuple[int, int]:
+        """Get the (home, away) team indexes of the fixture at an index."""
+        day, slot = divmod(index, self.per_day)
+        rounds = self._slots - 1
+        leg, rnd = divmod(day, rounds)
+        if self._slots != len(self.order):
+            slot += 1  # slot 0 would be the bye
+        if slot == 0:
+            home, away = rounds, rnd
+        else:
+            home, away = (rnd + slot) % rounds, (rnd - slot) % rounds
+        if rnd % 2 != leg:
+            home, away = away, home
+        return self.order[home], self.order[away]
+
+    def fixture_teams(self, index: int) -> Tuple[Team, Team]:
+        """Get the (home, away) teams of a fixture without building a Match."""
+        home, away = self.pairing(index)
+        return self._teams[home], self._teams[away]
+
+    def matchday(self, matchday: int) -> Iterator[Tuple[Team, Team]]:
+        """Yield the (home, away) teams of a matchday (1-based)."""
+        start = (matchday - 1) * self.per_day
+        for index in range(start, start + self.per_day):
+            yield self.fixture_teams(index)
+
+    def __len__(self) -> int:
+        return 2 * (self._slots - 1) * self.per_day
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("fixture index out of range")
+        entry = self._played.get(index)
+        if entry is None:
+            home, away = self.pairing(index)
+            return Match(self._teams[home], self._teams[away])
+        if isinstance(entry, Match):
+            return entry
+        match = self._hydrate(entry)
+        if not isinstance(entry, MatchRecord):
+            self._played[index] = match
+        return match
+
+    def __setitem__(self, index: int, value) -> None:
+        self._played[index] = value
+
+    def __delitem__(self, index) -> None:
+        raise TypeError("fixtures cannot be removed from a schedule")
+
+    def insert(self, index: int, value: Match) -> None:
+        raise TypeError("fixtures cannot be added to a schedule")
+
+    def played(self) -> Dict[int, Any]:
+        """Get the stored entries by index, without hydrating them."""
+        return dict(self._played)
+
+    def forget(self, index: int) -> None:
+        """Drop a stored entry, e.g. once a match no longer needs to be kept."""
+        self._played.pop(index, None)
+
+    def copy(self, teams: Optional[List[Team]] = None,
+             hydrate: Optional[Callable[[Any], Match]] = None) -> "FixtureSchedule":
+        """Copy with the same pairing order and stored entries, optionally for other teams."""
+        return FixtureSchedule(self._teams if teams is None else teams, self.order,
+                               self._played, hydrate or self._hydrate)
+
+
+class _StandingsMixin:
+    """Read-only league views computed from ``self.teams``.
+
+    Leaderboards use a bounded heap, so they cost O(players * log(limit))
+    rather than a full sort.
+    """
+    teams: List[Team]
+
+    def _players(self) -> Iterator[Player]:
+        return (p for team in self.teams for p in team.players)
+
+    def get_league_table(self, limit: Optional[int] = None) -> List[Team]:
+        """Get the current league table sorted by points and goal difference."""
+        key = lambda t: (t.points, t.goal_difference, t.goals_for)
+        if limit is not None:
+            return heapq.nlargest(limit, self.teams, key=key)
+        return sorted(self.teams, key=key, reverse=True)
+
+    def get_top_scorers(self, limit: int = 5) -> List[Player]:
+        """Get the top goal scorers."""
+        return heapq.nlargest(limit, self._players(), key=lambda p: p.goals)
+
+    def get_top_assisters(self, limit: int = 5) -> List[Player]:
+        """Get the top assisters."""
+        return heapq.nlargest(limit, self._players(), key=lambda p: p.assists)
+
+    def get_top_clean_sheets(self, limit: int = 5) -> List[Player]:
+        """Get the goalkeepers with most clean sheets."""
+        goalkeepers = (p for p in self._players() if p.position == "GK")
+        return heapq.nlargest(limit, goalkeepers, key=lambda p: p.clean_sheets)
+
+    def get_disciplinary_table(self, limit: int = 5) -> List[Player]:
+        """Get players with most cards (yellow cards count as 1, red cards as 2)."""
+        return heapq.nlargest(limit, self._players(), key=lambda p: p.yellow_cards + p.red_cards * 2)
+
+    def get_pass_masters(self, limit: int = 5) -> List[Player]:
+        """Get players with best pass accuracy (minimum 100 passes)."""
+        qualified = (p for p in self._players() if p.passes >= 100)
+        return heapq.nlargest(limit, qualified, key=lambda p: p.pass_accuracy)
+
+
+def _copy_team(team: Team) -> Team:
+    """Copy a team and its players so later simulation cannot change the copy."""
+    clone = copy.copy(team)
+    clone.players = [copy.copy(p) for p in team.players]
+    return clone
+
+
+@dataclass(frozen=True)
+class LeagueSnapshot(_StandingsMixin):
+    """Immutable, consistent view of a league's standings at one point in time."""
+    name: str
+    teams: Tuple[Team, ...]
+    current_matchday: int
+    version: int
+
+
+_league_tokens = itertools.count()
+
+
 @dataclass
-class League:
+class League(_StandingsMixin):
     name: str
     teams: List[Team]
     matches: List[Match] = field(default_factory=list)
     current_matchday: int = 0
+    goal_model: Optional[PoissonGoalModel] = None
+    rating_model: Optional[RatingModel] = None
+    # Played matches kept: "full" matches, "seed" records to replay them, or "none"
+    history: str = "full"
+    seed: Optional[int] = None
+    params: Optional[SimulationParams] = None
+    # Builds a Match from a raw saved entry and the league's teams by name (set when loading)
+    entry_loader: Optional[Callable[[Any, Dict[str, Team]], Match]] = field(
+        default=None, repr=False, compare=False)
+    version: int = field(default=0, init=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    _snapshot: Optional[LeagueSnapshot] = field(default=None, init=False, repr=False, compare=False)
+    # Ids of teams this league may mutate in place; None until the league is forked
+    _owned: Optional[set] = field(default=None, init=False, repr=False, compare=False)
+    _pinned: Dict[int, Tuple[int, int]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _rng: random.Random = field(init=False, repr=False, compare=False)
+    _positions: Optional[Dict[str, int]] = field(default=None, init=False, repr=False, compare=False)
+    _token: int = field(default_factory=lambda: next(_league_tokens), init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.history not in ("full", "seed", "none"):
+            raise ValueError(f"Unknown history mode: {self.history}")
+        # Without a seed, draw one from the global generator so random.seed() still reproduces a run
+        self._rng = random.Random(self.seed if self.seed is not None else random.getrandbits(64))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The lock and published snapshot are per-process; rebuild them on load
+        state = self.__dict__.copy()
+        for name in ('_lock', '_snapshot', '_owned', '_positions'):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._snapshot = None
+        # A copy owns all of its teams and is a different league for caching
+        self._owned = None
+        self._positions = None
+        self._token = next(_league_tokens)
+
+    @property
+    def token(self) -> int:
+        """Identifies this league for caches; unlike ``id()``, never reused in a process."""
+        return self._token
+
+    def generate_fixtures(self, lazy: bool = False) -> None:
+        """Generate a full season of fixtures with home and away matches.
+
+        With ``lazy``, fixtures come from a :class:`FixtureSchedule` that computes
+        each matchday on demand, which keeps very large leagues in bounded memory.
+        """
+        if lazy:
+            order = list(range(len(self.teams)))
+            self._rng.shuffle(order)
+            self.matches = FixtureSchedule(self.teams, order, hydrate=self.hydrate)
+            return
 
-    def generate_fixtures(self) -> None:
-        """Generate a full season of fixtures with home and away matches."""
         # Clear any existing matches
         self.matches = []
         
@@ -308,7 +717,7 @@ class League:
             fixtures.append(Match(away, home))  # Return fixture
         
         # Shuffle the fixtures
-        random.shuffle(fixtures)
+        self._rng.shuffle(fixtures)
         self.matches = fixtures
 
     def get_matchday_fixtures(self, matchday: int) -> List[Match]:
@@ -319,45 +728,211 @@ class League:
         return self.matches[start_idx:end_idx]
 
     def simulate_matchday(self) -> List[Match]:
-        """Simulate the next matchday's matches."""
-        if self.current_matchday >= len(self.matches) // (len(self.teams) // 2):
-            return []
-
-        self.current_matchday += 1
-        fixtures = self.get_matchday_fixtures(self.current_matchday)
-        for match in fixtures:
-            match.simulate()
-        return fixtures
-
-    def get_league_table(self) -> List[Team]:
-        """Get the current league table sorted by points and goal difference."""
-        return sorted(
-            self.teams,
-            key=lambda t: (t.points, t.goal_difference, t.goals_for),
-            reverse=True
-        )
-
-    def get_top_scorers(self, limit: int = 5) -> List[Player]:
-        """Get the top goal scorers."""
-        all_players = [p for team in self.teams for p in team.players]
-        return sorted(all_players, key=lambda p: p.goals, reverse=True)[:limit]
-
-    def get_top_assisters(self, limit: int = 5) -> List[Player]:
-        """Get the top assisters."""
-        all_players = [p for team in self.teams for p in team.players]
-        return sorted(all_players, key=lambda p: p.assists, reverse=True)[:limit]
-
-    def get_top_clean_sheets(self, limit: int = 5) -> List[Player]:
-        """Get the goalkeepers with most clean sheets."""
-        goalkeepers = [p for team in self.teams for p in team.players if p.position == "GK"]
-        return sorted(goalkeepers, key=lambda p: p.clean_sheets, reverse=True)[:limit]
-
-    def get_disciplinary_table(self, limit: int = 5) -> List[Player]:
-        """Get players with most cards (yellow cards count as 1, red cards as 2)."""
-        all_players = [p for team in self.teams for p in team.players]
-        return sorted(all_players, key=lambda p: p.yellow_cards + p.red_cards * 2, reverse=True)[:limit]
-
-    def get_pass_masters(self, limit: int = 5) -> List[Player]:
-        """Get players with best pass accuracy (minimum 100 passes)."""
-        all_players = [p for team in self.teams for p in team.players if p.passes >= 100]
-        return sorted(all_players, key=lambda p: p.pass_accuracy, reverse=True)[:limit] 
\ No newline at end of file
+        """Simulate the next matchday's matches.
+
+        A new snapshot is published after every match, so readers using
+        :meth:`snapshot` never see a half-applied result.
+        """
+        with self._lock:
+            if self.current_matchday >= len(self.matches) // (len(self.teams) // 2):
+                return []
+
+            self.current_matchday += 1
+            fixtures = self.get_matchday_fixtures(self.current_matchday)
+            first = (self.current_matchday - 1) * (len(self.teams) // 2)
+            if self.history == "seed" and not isinstance(self.matches, (LazyMatchList, FixtureSchedule)):
+                self.matches = LazyMatchList(self.matches, self.hydrate)
+            for i, match in enumerate(fixtures):
+                if self._owned is not None:
+                    match = fixtures[i] = self._own_fixture(first + i, match)
+                record = self._simulate_recorded(match, self._pinned.pop(first + i, None))
+                if self.history == "seed":
+                    self.matches[first + i] = record
+                elif self.history == "full":
+                    self.matches[first + i] = match
+                elif isinstance(self.matches, FixtureSchedule):
+                    self.matches.forget(first + i)
+                else:
+                    # Keep only the pairing, which saves as a compact fixture
+                    self.matches[first + i] = Match(match.home_team, match.away_team)
+                self._changed(match.home_team, match.away_team)
+            if self.rating_model is not None:
+                if self._owned is not None:
+                    for team in list(self.teams):
+                        self._own_team(team.name)
+                self.rating_model.update_from_matches(fixtures)
+                self._changed(*self.rating_model.apply(self.teams, self.goal_model))
+            VIEW_CACHE.invalidate(self)
+            return fixtures
+
+    def _simulate_recorded(self, match: Match, score: Optional[Tuple[int, int]]) -> MatchRecord:
+        """Simulate a match from a fresh seed and return the record that reproduces it."""
+        seed = self._rng.getrandbits(64)
+        home_rating, away_rating = match.home_team.team_rating, match.away_team.team_rating
+        home_strengths = MatchRecord.strengths_of(match.home_team)
+        away_strengths = MatchRecord.strengths_of(match.away_team)
+        goal_rates = None
+        if self.goal_model is not None:
+            goal_rates = (self.goal_model.home_goal_rate, self.goal_model.away_goal_rate)
+        match.simulate(self.goal_model, score, random.Random(seed), self.params)
+        return MatchRecord(match.home_team.name, match.away_team.name, seed,
+                           home_rating, away_rating, match.result_digest(),
+                           home_strengths, away_strengths, score, goal_rates)
+
+    def _team_position(self, name: str) -> int:
+        """Index of a team in ``teams`` by name (cached; teams are only ever replaced in place)."""
+        index = self._positions.get(name) if self._positions is not None else None
+        if index is None or index >= len(self.teams) or self.teams[index].name != name:
+            self._positions = {t.name: i for i, t in enumerate(self.teams)}
+            index = self._positions[name]
+        return index
+
+    def hydrate(self, entry: Any) -> Match:
+        """Build a match from a stored entry against this league's teams."""
+        if isinstance(entry, MatchRecord):
+            return self.replay(entry)
+        return self.entry_loader(entry, {t.name: t for t in self.teams})
+
+    def replay(self, record: MatchRecord) -> Match:
+        """Re-derive and verify a completed match from its seed record."""
+        home = self.teams[self._team_position(record.home_team)]
+        away = self.teams[self._team_position(record.away_team)]
+        return record.replay(home, away, self.goal_model, self.params)
+
+    def _own_team(self, name: str) -> Team:
+        """Get this league's team by name, copying it first if it is shared with a fork."""
+        index = self._team_position(name)
+        team = self.teams[index]
+        if id(team) not in self._owned:
+            team = self.teams[index] = _copy_team(team)
+            self._owned.add(id(team))
+        return team
+
+    def _own_fixture(self, index: int, match: Match) -> Match:
+        """Replace a (possibly shared) unplayed fixture with one between owned teams."""
+        fixture = Match(self._own_team(match.home_team.name), self._own_team(match.away_team.name))
+        self.matches[index] = fixture
+        return fixture
+
+    def fork(self, seed: Optional[int] = None) -> "League":
+        """
+        Create a what-if branch of the league.
+
+        The branch shares fixtures, completed matches and unchanged teams with
+        this league. Whichever side plays a team next copies it first, so the
+        two leagues never see each other's results. Branches keep the history
+        mode but do not share or inherit the rating model.
+
+        Args:
+            seed: Seed for the branch's random generator. By default it starts
+                from this league's current state, so an unpinned branch plays
+                out exactly as this league would.
+
+        Returns:
+            A new League that can be pinned and simulated independently
+        """
+        with self._lock:
+            branch = League(self.name, list(self.teams), self.matches.copy(),
+                            self.current_matchday,
+                            # Own copy: a rating model refits the parent's in place
+                            goal_model=replace(self.goal_model) if self.goal_model else None,
+                            history=self.history,
+                            seed=self.seed if seed is None else seed,
+                            params=self.params, entry_loader=self.entry_loader)
+            if seed is None:
+                branch._rng.setstate(self._rng.getstate())
+            if isinstance(branch.matches, FixtureSchedule):
+                branch.matches = branch.matches.copy(branch.teams, branch.hydrate)
+            elif isinstance(branch.matches, LazyMatchList):
+                branch.matches = branch.matches.copy(branch.hydrate)
+            branch.version = self.version
+            branch._snapshot = self._snapshot
+            branch._pinned = dict(self._pinned)
+            branch._owned = set()
+            self._owned = set()
+            return branch
+
+    def pin_result(self, match_index: int, home_goals: int, away_goals: int) -> None:
+        """
+        Fix the score of an unplayed fixture; its other statistics are still simulated.
+
+        Args:
+            match_index: Index of the fixture in ``matches``
+            home_goals: Goals for the home team
+            away_goals: Goals for the away team
+
+        Raises:
+            IndexError: If there is no fixture at ``match_index``
+            ValueError: If the fixture has already been played or a score is
+                not a non-negative integer
+        """
+        if not 0 <= match_index < len(self.matches):
+            raise IndexError(f"No fixture at index {match_index}")
+        for goals in (home_goals, away_goals):
+            if not isinstance(goals, int) or isinstance(goals, bool) or goals < 0:
+                raise ValueError(f"Goals must be a non-negative integer, got {goals!r}")
+        if match_index < self.current_matchday * (len(self.teams) // 2):
+            raise ValueError(f"Fixture {match_index} has already been played")
+        self._pinned[match_index] = (home_goals, away_goals)
+
+    def remaining_fixtures(self, team_name: str) -> List[int]:
+        """Get the indexes of a team's unplayed fixtures, in the order they will be played."""
+        first = self.current_matchday * (len(self.teams) // 2)
+        return [
+            i for i in range(first, len(self.matches))
+            if team_name in (self.matches[i].home_team.name, self.matches[i].away_team.name)
+        ]
+
+    def simulate_remaining(self) -> None:
+        """Simulate every remaining matchday."""
+        while self.simulate_matchday():
+            pass
+
+    def _changed(self, *teams: Team) -> None:
+        """Record that teams changed; publish a snapshot if any reader uses them."""
+        self.version += 1
+        if self._snapshot is not None:
+            self._publish(*teams)
+
+    def _publish(self, *changed: Team) -> None:
+        """Publish a new snapshot, copying only the teams that changed (caller holds the lock)."""
+        previous = self._snapshot
+        if previous is None or len(previous.teams) != len(self.teams):
+            teams = tuple(_copy_team(t) for t in self.teams)
+        else:
+            changed_ids = {id(t) for t in changed}
+            teams = tuple(
+                _copy_team(team) if id(team) in changed_ids else old
+                for team, old in zip(self.teams, previous.teams)
+            )
+        self._snapshot = LeagueSnapshot(self.name, teams, self.current_matchday, self.version)
+
+    def publish(self) -> LeagueSnapshot:
+        """Publish a fresh snapshot after changing teams outside :meth:`simulate_matchday`."""
+        with self._lock:
+            self.version += 1
+            self._publish(*self.teams)
+            VIEW_CACHE.invalidate(self)
+            return self._snapshot
+
+    def snapshot(self) -> LeagueSnapshot:
+        """
+        Get the latest published standings.
+
+        Safe to call from any thread while another thread simulates: the snapshot
+        is immutable and replaced atomically, so readers never block the simulation.
+        Snapshots are only maintained once this has been called, so call it
+        before starting a simulation thread to avoid the first read waiting.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            # Nothing changed, so the first snapshot keeps the current version
+            with self._lock:
+                if self._snapshot is None:
+                    self._publish(*self.teams)
+                snapshot = self._snapshot
+        return snapshot
+
+    def project_table(self, goal_model: Optional[PoissonGoalModel] = None) -> List[TeamProjection]:
+        """Project expected points and position probabilities over the remaining fixtures."""
+        return project_league(self, goal_model)
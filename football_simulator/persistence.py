@@ -1,13 +1,38 @@
 """
 Module for saving and loading season data.
 """
+import gzip
+import itertools
 import json
+import lzma
 import os
-from dataclasses import asdict
-from typing import Dict, Any, Optional
+from dataclasses import asdict, fields
+from typing import Callable, Dict, Any, Optional, TextIO
 from datetime import datetime
 
-from .models import League, Team, Player, Match, MatchStats
+try:  # Python 3.14+
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+from .goal_models import PoissonGoalModel
+from .models import (
+    League, Team, Player, Match, MatchStats, MatchRecord, LazyMatchList, FixtureSchedule,
+    SimulationParams
+)
+
+# Save layout version: header on the first line, then one match per line
+SAVE_FORMAT = 2
+
+# Supported compression codecs: file suffix, leading magic bytes and opener
+_CODECS: Dict[str, tuple] = {
+    'gzip': ('.gz', b'\x1f\x8b', lambda path, mode: gzip.open(path, mode, compresslevel=6, encoding='utf-8')),
+    'xz': ('.xz', b'\xfd7zXZ\x00', lambda path, mode: lzma.open(path, mode, encoding='utf-8')),
+}
+if zstd is not None:
+    _CODECS['zstd'] = ('.zst', b'\x28\xb5\x2f\xfd', lambda path, mode: zstd.open(path, mode, encoding='utf-8'))
+
+_SAVE_SUFFIXES = ('.json',) + tuple('.json' + suffix for suffix, _, _ in _CODECS.values())
 
 
 def _serialize_match_stats(stats: MatchStats) -> Dict[str, Any]:
@@ -39,14 +64,15 @@ def _serialize_team(team: Team) -> Dict[str, Any]:
 
 def _deserialize_team(data: Dict[str, Any]) -> Team:
     """Create Team from a dictionary."""
-    players_data = data.pop('players')
-    team = Team(**data)
-    team.players = [_deserialize_player(p) for p in players_data]
+    team = Team(**{k: v for k, v in data.items() if k != 'players'})
+    team.players = [_deserialize_player(p) for p in data['players']]
     return team
 
 
 def _serialize_match(match: Match) -> Dict[str, Any]:
-    """Convert Match to a dictionary."""
+    """Convert Match to a dictionary (unplayed fixtures only store team names)."""
+    if not match.completed:
+        return {'fixture': [match.home_team.name, match.away_team.name]}
     return {
         'home_team': _serialize_team(match.home_team),
         'away_team': _serialize_team(match.away_team),
@@ -60,74 +86,273 @@ def _serialize_match(match: Match) -> Dict[str, Any]:
     }
 
 
-def _deserialize_match(data: Dict[str, Any]) -> Match:
-    """Create Match from a dictionary."""
+def _deserialize_match(data: Dict[str, Any], teams: Optional[Dict[str, Team]] = None) -> Match:
+    """
+    Create Match from a dictionary.
+
+    Teams found in ``teams`` (by name) are reused, and scorers and assisters are
+    resolved to their players, so the match updates the league's own teams.
+    """
+    teams = teams or {}
+    if 'fixture' in data:
+        home, away = data['fixture']
+        return Match(teams[home], teams[away])
+    home_team = teams.get(data['home_team']['name']) or _deserialize_team(data['home_team'])
+    away_team = teams.get(data['away_team']['name']) or _deserialize_team(data['away_team'])
+    players = {p.name: p for p in home_team.players + away_team.players}
+
+    def resolve(player_data: Dict[str, Any]) -> Player:
+        return players.get(player_data['name']) or _deserialize_player(player_data)
+
     return Match(
-        home_team=_deserialize_team(data['home_team']),
-        away_team=_deserialize_team(data['away_team']),
+        home_team=home_team,
+        away_team=away_team,
         home_goals=data['home_goals'],
         away_goals=data['away_goals'],
-        scorers=[_deserialize_player(p) for p in data['scorers']],
-        assisters=[_deserialize_player(p) for p in data['assisters']],
+        scorers=[resolve(p) for p in data['scorers']],
+        assisters=[resolve(p) for p in data['assisters']],
         home_stats=_deserialize_match_stats(data['home_stats']),
         away_stats=_deserialize_match_stats(data['away_stats']),
         completed=data['completed']
     )
 
 
-def _serialize_league(league: League) -> Dict[str, Any]:
-    """Convert League to a dictionary."""
+def _serialize_match_record(record: MatchRecord) -> Dict[str, Any]:
+    """Convert a MatchRecord to a dictionary."""
+    return {'record': asdict(record)}
+
+
+def _deserialize_match_record(data: Dict[str, Any]) -> MatchRecord:
+    """Create MatchRecord from a dictionary."""
+    data = dict(data['record'])
+    for key in ('home_strengths', 'away_strengths', 'score', 'goal_rates'):
+        if data.get(key) is not None:
+            data[key] = tuple(data[key])
+    return MatchRecord(**data)
+
+
+def _parse_entry(entry: Any) -> Any:
+    """Parse seed records straight away; leave full match entries raw."""
+    if isinstance(entry, str):
+        if not entry.startswith('{"record"'):
+            return entry
+        entry = json.loads(entry)
+    if 'record' in entry:
+        return _deserialize_match_record(entry)
+    return entry
+
+
+def _hydrate_match(entry: Any, teams: Dict[str, Team]) -> Match:
+    """Create Match from a raw save entry (a JSON line or a parsed dictionary)."""
+    if isinstance(entry, str):
+        entry = json.loads(entry)
+    return _deserialize_match(entry, teams)
+
+
+def _dump_match_entry(entry: Any) -> str:
+    """Convert a match, record, or unhydrated lazy entry to a single JSON line."""
+    if isinstance(entry, str):
+        return entry
+    if isinstance(entry, Match):
+        entry = _serialize_match(entry)
+    elif isinstance(entry, MatchRecord):
+        entry = _serialize_match_record(entry)
+    return json.dumps(entry)
+
+
+def _split_indexed_entry(line: Any) -> tuple:
+    """Split a schedule line ``[index, entry]`` without parsing the entry itself."""
+    if not isinstance(line, str):
+        return line[0], line[1]
+    index, _, entry = line[1:-1].partition(',')
+    return int(index), entry.strip()
+
+
+def _serialize_goal_model(model: Optional[PoissonGoalModel]) -> Optional[Dict[str, Any]]:
+    """Convert a goal model's parameters (not its cache) to a dictionary."""
+    if model is None:
+        return None
+    return {f.name: getattr(model, f.name) for f in fields(model) if f.init}
+
+
+def _deserialize_goal_model(data: Optional[Dict[str, Any]]) -> Optional[PoissonGoalModel]:
+    """Create a goal model from a dictionary."""
+    return PoissonGoalModel(**data) if data is not None else None
+
+
+def _serialize_params(params: Optional[SimulationParams]) -> Optional[Dict[str, Any]]:
+    """Convert SimulationParams to a dictionary."""
+    return asdict(params) if params is not None else None
+
+
+def _deserialize_params(data: Optional[Dict[str, Any]]) -> Optional[SimulationParams]:
+    """Create SimulationParams from a dictionary."""
+    if data is None:
+        return None
+    # Older saves may hold parameters that have since been removed
+    known = {f.name for f in fields(SimulationParams)}
+    return SimulationParams(**{k: tuple(v) if isinstance(v, list) else v
+                               for k, v in data.items() if k in known})
+
+
+def _serialize_league_header(league: League) -> Dict[str, Any]:
+    """Convert everything except the matches of a League to a dictionary."""
     return {
+        'format': SAVE_FORMAT,
         'name': league.name,
+        'current_matchday': league.current_matchday,
+        'history': league.history,
+        'goal_model': _serialize_goal_model(league.goal_model),
+        'params': _serialize_params(league.params),
         'teams': [_serialize_team(t) for t in league.teams],
-        'matches': [_serialize_match(m) for m in league.matches],
-        'current_matchday': league.current_matchday
+        **({'schedule': {'order': league.matches.order}}
+           if isinstance(league.matches, FixtureSchedule) else {}),
     }
 
 
-def _deserialize_league(data: Dict[str, Any]) -> League:
-    """Create League from a dictionary."""
+def _deserialize_league(data: Dict[str, Any], lazy: bool = False) -> League:
+    """Create League from a dictionary (matches may be dictionaries or JSON lines)."""
     teams = [_deserialize_team(t) for t in data['teams']]
-    matches = [_deserialize_match(m) for m in data['matches']]
-    league = League(data['name'], teams)
-    league.matches = matches
+    league = League(data['name'], teams, history=data.get('history', 'full'),
+                    goal_model=_deserialize_goal_model(data.get('goal_model')),
+                    params=_deserialize_params(data.get('params')),
+                    entry_loader=_hydrate_match)
+    hydrate = league.hydrate
+
+    if 'schedule' in data:
+        # Only played matches are stored, each as [index, entry]
+        played = {}
+        for line in data['matches']:
+            index, entry = _split_indexed_entry(line)
+            entry = _parse_entry(entry)
+            played[index] = entry if lazy or isinstance(entry, MatchRecord) else hydrate(entry)
+        league.matches = FixtureSchedule(teams, data['schedule']['order'], played, hydrate)
+        league.current_matchday = data['current_matchday']
+        return league
+
+    entries = [_parse_entry(m) for m in data['matches']]
+    if lazy:
+        league.matches = LazyMatchList(entries, hydrate)
+    elif any(isinstance(e, MatchRecord) for e in entries):
+        league.matches = LazyMatchList(
+            [e if isinstance(e, MatchRecord) else hydrate(e) for e in entries], hydrate
+        )
+    else:
+        league.matches = [hydrate(e) for e in entries]
     league.current_matchday = data['current_matchday']
     return league
 
 
-def save_league(league: League, save_dir: str = "saves") -> str:
+def _write_league(league: League, f: TextIO) -> None:
+    """
+    Write a league as JSON with the header on the first line and one match per line.
+
+    The output is a single valid JSON document, written match by match so the
+    whole save is never held in memory as one string. Leagues on a lazy
+    :class:`FixtureSchedule` store only the matches kept in it, as ``[index, entry]``.
+    """
+    header = json.dumps(_serialize_league_header(league))
+    f.write(header[:-1] + ',\n"matches": [\n')
+    if isinstance(league.matches, FixtureSchedule):
+        played = sorted(league.matches.played().items())
+        count = len(played)
+        lines = (f'[{i}, {_dump_match_entry(e)}]' for i, e in played)
+    else:
+        entries = (
+            league.matches.entries() if isinstance(league.matches, LazyMatchList)
+            else league.matches
+        )
+        count = len(entries)
+        lines = (_dump_match_entry(entry) for entry in entries)
+    for i, line in enumerate(lines):
+        f.write(line)
+        f.write(',\n' if i < count - 1 else '\n')
+    f.write(']}\n')
+
+
+def _read_league(f: TextIO, lazy: bool = False) -> League:
+    """Read a league written by :func:`_write_league`, or a legacy JSON save."""
+    first = f.readline()
+    if first.strip() == '{':
+        # Legacy indented save: the whole document has to be parsed
+        return _deserialize_league(json.loads(first + f.read()), lazy)
+
+    data = json.loads(first.rstrip().rstrip(',') + '}')
+    f.readline()  # '"matches": ['
+    data['matches'] = [line.rstrip().rstrip(',') for line in f]
+    data['matches'].pop()  # closing ']}'
+    return _deserialize_league(data, lazy)
+
+
+def _plain_open(filepath: str, mode: str) -> TextIO:
+    """Open an uncompressed save file."""
+    return open(filepath, mode, encoding='utf-8')
+
+
+def _opener_for(filepath: str) -> Callable[[str, str], TextIO]:
+    """Detect a save file's compression from its leading bytes."""
+    with open(filepath, 'rb') as f:
+        magic = f.read(6)
+    for _, codec_magic, opener in _CODECS.values():
+        if magic.startswith(codec_magic):
+            return opener
+    return _plain_open
+
+
+def save_league(league: League, save_dir: str = "saves", compression: Optional[str] = None) -> str:
     """
     Save the league state to a JSON file.
     
     Args:
         league: The league to save
         save_dir: Directory to save the file in
+        compression: Optional codec ('gzip', 'xz', or 'zstd' on Python 3.14+);
+            the JSON is streamed through the compressor as it is written
         
     Returns:
         The path to the saved file
+
+    Raises:
+        ValueError: If the compression codec is not supported
     """
+    if compression is not None and compression not in _CODECS:
+        raise ValueError(f"Unsupported compression: {compression}")
+
     # Create saves directory if it doesn't exist
     os.makedirs(save_dir, exist_ok=True)
     
-    # Generate filename with timestamp
+    # Generate filename with timestamp, numbered if a save already has it
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"league_save_{timestamp}.json"
-    filepath = os.path.join(save_dir, filename)
-    
+    if compression is None:
+        suffix, opener = '.json', _plain_open
+    else:
+        codec_suffix, _, opener = _CODECS[compression]
+        suffix = '.json' + codec_suffix
+    for attempt in itertools.count():
+        filename = f"league_save_{timestamp}{f'_{attempt}' if attempt else ''}{suffix}"
+        filepath = os.path.join(save_dir, filename)
+        try:
+            # Exclusive creation, so concurrent or back-to-back saves never overwrite
+            f = opener(filepath, 'xt')
+        except FileExistsError:
+            continue
+        break
+
     # Serialize and save
-    data = _serialize_league(league)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    with f:
+        _write_league(league, f)
         
     return filepath
 
 
-def load_league(filepath: str) -> League:
+def load_league(filepath: str, lazy: bool = False) -> League:
     """
-    Load a league from a save file.
+    Load a league from a save file, which may be compressed.
     
     Args:
         filepath: Path to the save file
+        lazy: Build teams immediately but parse and build matches only when
+            first accessed, so the league table is available almost at once
         
     Returns:
         The loaded League object
@@ -136,9 +361,8 @@ def load_league(filepath: str) -> League:
         FileNotFoundError: If the save file doesn't exist
         json.JSONDecodeError: If the save file is invalid
     """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return _deserialize_league(data)
+    with _opener_for(filepath)(filepath, 'rt') as f:
+        return _read_league(f, lazy)
 
 
 def list_saves(save_dir: str = "saves") -> list[str]:
@@ -157,7 +381,7 @@ def list_saves(save_dir: str = "saves") -> list[str]:
     return [
         os.path.join(save_dir, f)
         for f in os.listdir(save_dir)
-        if f.startswith("league_save_") and f.endswith(".json")
+        if f.startswith("league_save_") and f.endswith(_SAVE_SUFFIXES)
     ]
 
 
@@ -0,0 +1,289 @@
+"""
+Analytical league table projection from per-fixture outcome probabilities.
+"""
+from dataclasses import dataclass
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from .goal_models import PoissonGoalModel
+
+if TYPE_CHECKING:
+    from .models import League, Match, Team
+
+# Probabilities below this are treated as impossible when projecting positions
+_EPSILON = 1e-12
+# Points totals less likely than this are dropped while convolving
+_NEGLIGIBLE = 1e-16
+
+# Above this many teams, position probabilities use a normal approximation
+EXACT_POSITIONS_MAX_TEAMS = 40
+
+
+@dataclass
+class TeamProjection:
+    """Projected end-of-season outcome for a single team."""
+    team: "Team"
+    expected_points: float
+    points_distribution: List[float]
+    position_probabilities: List[float]
+
+    @property
+    def min_points(self) -> int:
+        """Points already banked (index 0 of the points distribution)."""
+        return self.team.points
+
+    @property
+    def expected_position(self) -> float:
+        """Expected final league position (1-based)."""
+        return sum(pos * p for pos, p in enumerate(self.position_probabilities, 1))
+
+    def probability_of_points(self, points: int) -> float:
+        """Probability of finishing the season on exactly ``points``."""
+        idx = points - self.min_points
+        if 0 <= idx < len(self.points_distribution):
+            return self.points_distribution[idx]
+        return 0.0
+
+
+def _convolve(dist: List[float], win: float, draw: float, loss: float) -> Tuple[int, List[float]]:
+    """
+    Add one fixture's 0/1/3 points outcome to a points distribution.
+
+    Negligible tails are dropped so long seasons stay cheap; returns how many
+    leading points totals were dropped along with the new distribution.
+    """
+    result = [0.0] * (len(dist) + 3)
+    for pts, p in enumerate(dist):
+        if p:
+            result[pts] += p * loss
+            result[pts + 1] += p * draw
+            result[pts + 3] += p * win
+    while len(result) > 1 and result[-1] < _NEGLIGIBLE:
+        result.pop()
+    start = 0
+    while start < len(result) - 1 and result[start] < _NEGLIGIBLE:
+        start += 1
+    return start, result[start:] if start else result
+
+
+def _count_ahead(probabilities: Sequence[float]) -> List[float]:
+    """Distribution of how many independent events (with given probabilities) occur."""
+    dist = [1.0]
+    for q in probabilities:
+        if q < _EPSILON:
+            continue
+        if q > 1 - _EPSILON:
+            dist.insert(0, 0.0)
+            continue
+        new = [p * (1 - q) for p in dist]
+        new.append(0.0)
+        for k, p in enumerate(dist):
+            new[k + 1] += p * q
+        dist = new
+    return dist
+
+
+def _remaining_pairings(league: "League") -> Iterable[Tuple["Team", "Team"]]:
+    """(home, away) teams of the fixtures after the current matchday."""
+    from .models import FixtureSchedule
+
+    first = league.current_matchday * (len(league.teams) // 2)
+    if isinstance(league.matches, FixtureSchedule):
+        # Avoid building a Match for every remaining fixture of a large league
+        schedule = league.matches
+        return (schedule.fixture_teams(i) for i in range(first, len(schedule)))
+    return ((m.home_team, m.away_team) for m in league.matches[first:])
+
+
+def _remove_event(dist: List[float], q: float) -> List[float]:
+    """Undo one event of :func:`_count_ahead`: the distribution without an event of probability ``q``."""
+    if q < _EPSILON:
+        return list(dist)
+    if q > 1 - _EPSILON:
+        return dist[1:]
+    result = [0.0] * (len(dist) - 1)
+    carry = 0.0
+    if q <= 0.5:  # solve from the bottom up, which is stable for small q
+        for k in range(len(result)):
+            carry = (dist[k] - q * carry) / (1 - q)
+            result[k] = max(carry, 0.0)
+    else:
+        for k in range(len(result), 0, -1):
+            carry = (dist[k] - (1 - q) * carry) / q
+            result[k - 1] = max(carry, 0.0)
+    return result
+
+
+def _finish_above(dist: List[float]) -> Tuple[int, List[float]]:
+    """
+    Offset of the first plausible points total in a distribution and, from there
+    to the last plausible total, the probability of finishing above each one
+    (ties count half). Below that range the team is certainly above, beyond it below.
+    """
+    support = [idx for idx, p in enumerate(dist) if p >= _EPSILON]
+    first, last = support[0], support[-1]
+    above = [0.0] * (last - first + 1)
+    tail = sum(dist[last + 1:])
+    for idx in range(last, first - 1, -1):
+        above[idx - first] = tail + 0.5 * dist[idx]
+        tail += dist[idx]
+    return first, above
+
+
+def _exact_positions(
+    teams: Sequence["Team"],
+    distributions: Dict[str, List[float]],
+    ranges: Dict[str, Tuple[int, List[float]]],
+) -> Dict[str, List[float]]:
+    """Position probabilities from one Poisson-binomial per points total: O(P * n^2)."""
+    positions = {team.name: [0.0] * len(teams) for team in teams}
+    members: Dict[int, List[Tuple[str, float, float]]] = {}
+    for team in teams:
+        first, above = ranges[team.name]
+        for idx, q in enumerate(above):
+            p = distributions[team.name][first + idx]
+            if p >= _EPSILON:
+                members.setdefault(team.points + first + idx, []).append((team.name, p, q))
+
+    for pts, level in members.items():
+        certain = 0
+        uncertain = []
+        for team in teams:
+            first, above = ranges[team.name]
+            idx = pts - team.points - first
+            if idx < 0:
+                certain += 1
+            elif idx < len(above):
+                uncertain.append(above[idx])
+        everyone = _count_ahead(uncertain)
+        for name, p, q in level:
+            for k, r in enumerate(_remove_event(everyone, q)):
+                positions[name][certain + k] += p * r
+    return positions
+
+
+def _normal_positions(mean: float, sd: float, n_teams: int) -> List[float]:
+    """Discretize a normal distribution of the number of teams ahead onto positions."""
+    positions = [0.0] * n_teams
+    if sd < 1e-6:
+        positions[min(max(round(mean), 0), n_teams - 1)] = 1.0
+        return positions
+
+    def cdf(x: float) -> float:
+        return 0.5 * (1 + math.erf((x - mean) / (sd * math.sqrt(2))))
+
+    low = max(0, math.floor(mean - 8 * sd))
+    high = min(n_teams - 1, math.ceil(mean + 8 * sd))
+    for k in range(low, high + 1):
+        positions[k] = cdf(k + 0.5) - cdf(k - 0.5)
+    total = sum(positions)
+    return [p / total for p in positions] if total else positions
+
+
+def _approximate_positions(
+    teams: Sequence["Team"],
+    distributions: Dict[str, List[float]],
+    ranges: Dict[str, Tuple[int, List[float]]],
+) -> Dict[str, List[float]]:
+    """Position probabilities from the mean and variance of the number of teams ahead: O(n * P + n^2)."""
+    lowest = min(team.points + ranges[team.name][0] for team in teams)
+    highest = max(team.points + ranges[team.name][0] + len(ranges[team.name][1]) for team in teams)
+    certain = [0] * (highest - lowest + 1)
+    mean = [0.0] * (highest - lowest + 1)
+    var = [0.0] * (highest - lowest + 1)
+    for team in teams:
+        first, above = ranges[team.name]
+        start = team.points + first - lowest
+        certain[start] += 1  # certainly ahead of every lower total
+        for idx, q in enumerate(above):
+            mean[start + idx] += q
+            var[start + idx] += q * (1 - q)
+    ahead = 0
+    for level in range(len(certain) - 1, -1, -1):
+        mean[level] += ahead
+        ahead += certain[level]
+
+    positions = {}
+    for team in teams:
+        first, above = ranges[team.name]
+        start = team.points + first - lowest
+        total = expected = second = 0.0
+        for idx, q in enumerate(above):
+            p = distributions[team.name][first + idx]
+            if p < _EPSILON:
+                continue
+            m = mean[start + idx] - q
+            v = max(var[start + idx] - q * (1 - q), 0.0)
+            total += p
+            expected += p * m
+            second += p * (v + m * m)
+        expected /= total
+        sd = math.sqrt(max(second / total - expected * expected, 0.0))
+        positions[team.name] = _normal_positions(expected, sd, len(teams))
+    return positions
+
+
+def project_league(
+    league: "League",
+    goal_model: Optional[PoissonGoalModel] = None,
+    fixtures: Optional[Sequence["Match"]] = None,
+) -> List[TeamProjection]:
+    """
+    Project final standings analytically over the remaining fixtures.
+
+    Each remaining fixture contributes win/draw/loss probabilities from the goal
+    model; per-team points distributions are built by convolution. Position
+    probabilities treat teams' final points as independent and split ties evenly,
+    so they are an approximation.
+
+    For n teams, F remaining fixtures and P plausible points totals per team,
+    the points distributions cost O(F * P). Position probabilities are exact
+    (one Poisson-binomial per points total) up to ``EXACT_POSITIONS_MAX_TEAMS``
+    teams, at O(P * n^2); larger leagues use a normal approximation of the
+    number of teams finishing ahead, at O(n * P + n^2).
+
+    Args:
+        league: The league to project
+        goal_model: Model giving per-fixture outcome probabilities (defaults to
+            the league's goal model, or a rating-based Poisson model)
+        fixtures: Remaining fixtures (defaults to those after the current matchday)
+
+    Returns:
+        One projection per team, ordered by expected points
+    """
+    model = goal_model or league.goal_model or PoissonGoalModel()
+    if fixtures is None:
+        pairings = _remaining_pairings(league)
+    else:
+        pairings = ((m.home_team, m.away_team) for m in fixtures)
+
+    # Saved leagues may hold separate copies of teams in their matches
+    distributions: Dict[str, List[float]] = {t.name: [1.0] for t in league.teams}
+    offsets = {t.name: 0 for t in league.teams}
+    teams_by_name = {t.name: t for t in league.teams}
+    for home, away in pairings:
+        home = teams_by_name[home.name]
+        away = teams_by_name[away.name]
+        home_win, draw, away_win = model.outcome_probabilities(home, away)
+        for team, win, loss in ((home, home_win, away_win), (away, away_win, home_win)):
+            dropped, distributions[team.name] = _convolve(distributions[team.name], win, draw, loss)
+            offsets[team.name] += dropped
+    for name, offset in offsets.items():
+        if offset:
+            distributions[name] = [0.0] * offset + distributions[name]
+
+    # Each team's chance of finishing above every points total it might reach
+    ranges = {t.name: _finish_above(distributions[t.name]) for t in league.teams}
+    if len(league.teams) <= EXACT_POSITIONS_MAX_TEAMS:
+        positions = _exact_positions(league.teams, distributions, ranges)
+    else:
+        positions = _approximate_positions(league.teams, distributions, ranges)
+
+    projections = []
+    for team in league.teams:
+        dist = distributions[team.name]
+        expected = team.points + sum(idx * p for idx, p in enumerate(dist))
+        projections.append(TeamProjection(team, expected, dist, positions[team.name]))
+
+    projections.sort(key=lambda proj: proj.expected_points, reverse=True)
+    return projections
@@ -0,0 +1,206 @@
+"""
+Fitting team strengths from historical match results.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
+import csv
+
+from .goal_models import PoissonGoalModel
+
+if TYPE_CHECKING:
+    from .models import Match, Team
+
+Result = Tuple[str, str, int, int]
+
+
+def load_results_csv(
+    filepath: str,
+    home_col: str = "home_team",
+    away_col: str = "away_team",
+    home_goals_col: str = "home_goals",
+    away_goals_col: str = "away_goals",
+) -> Iterator[Result]:
+    """
+    Stream (home, away, home_goals, away_goals) results from a CSV file.
+
+    Args:
+        filepath: Path to the CSV file (must have a header row)
+        home_col: Column holding the home team name
+        away_col: Column holding the away team name
+        home_goals_col: Column holding goals scored by the home team
+        away_goals_col: Column holding goals scored by the away team
+
+    Returns:
+        An iterator over result tuples; rows with missing scores are skipped
+    """
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            home_goals, away_goals = row[home_goals_col], row[away_goals_col]
+            if home_goals == '' or away_goals == '':
+                continue
+            yield row[home_col], row[away_col], int(home_goals), int(away_goals)
+
+
+@dataclass
+class RatingModel:
+    """Poisson (Maher) team strength model fitted by maximum likelihood.
+
+    Home goals are Poisson with mean ``home_goal_rate * attack[home] * defence[away]``
+    and away goals with ``away_goal_rate * attack[away] * defence[home]``, matching
+    :class:`PoissonGoalModel`. Results are aggregated per fixture pair, so a fit
+    iteration costs O(pairs) however many matches have been recorded, and new
+    results refine the current fit rather than starting over.
+    """
+    home_goal_rate: float = 1.5
+    away_goal_rate: float = 1.15
+    attack: Dict[str, float] = field(default_factory=dict)
+    defence: Dict[str, float] = field(default_factory=dict)
+    shrinkage: float = 1.0
+    matches: int = 0
+    _pairs: Dict[Tuple[str, str], int] = field(default_factory=dict, repr=False)
+    _scored: Dict[str, int] = field(default_factory=dict, repr=False)
+    _conceded: Dict[str, int] = field(default_factory=dict, repr=False)
+    _home_goals: int = field(default=0, repr=False)
+    _away_goals: int = field(default=0, repr=False)
+
+    @classmethod
+    def from_csv(cls, filepath: str, **columns: str) -> "RatingModel":
+        """Fit a model to the results in a CSV file (see :func:`load_results_csv`)."""
+        model = cls()
+        model.add_results(load_results_csv(filepath, **columns))
+        model.fit()
+        return model
+
+    def add_result(self, home: str, away: str, home_goals: int, away_goals: int) -> None:
+        """Record a result without refitting."""
+        for name in (home, away):
+            if name not in self.attack:
+                self.attack[name] = 1.0
+                self.defence[name] = 1.0
+                self._scored[name] = 0
+                self._conceded[name] = 0
+        key = (home, away)
+        self._pairs[key] = self._pairs.get(key, 0) + 1
+        self._scored[home] += home_goals
+        self._scored[away] += away_goals
+        self._conceded[home] += away_goals
+        self._conceded[away] += home_goals
+        self._home_goals += home_goals
+        self._away_goals += away_goals
+        self.matches += 1
+
+    def add_results(self, results: Iterable[Result]) -> None:
+        """Record many results without refitting."""
+        for home, away, home_goals, away_goals in results:
+            self.add_result(home, away, home_goals, away_goals)
+
+    def _iterate(self) -> float:
+        """Run one fixed-point update and return the largest parameter change."""
+        h, w = self.home_goal_rate, self.away_goal_rate
+        attack, defence, s = self.attack, self.defence, self.shrinkage
+
+        exposure = dict.fromkeys(attack, 0.0)
+        for (home, away), n in self._pairs.items():
+            exposure[home] += n * h * defence[away]
+            exposure[away] += n * w * defence[home]
+        new_attack = {
+            name: (self._scored[name] + s) / (exposure[name] + s) for name in attack
+        }
+
+        exposure = dict.fromkeys(defence, 0.0)
+        for (home, away), n in self._pairs.items():
+            exposure[away] += n * h * new_attack[home]
+            exposure[home] += n * w * new_attack[away]
+        new_defence = {
+            name: (self._conceded[name] + s) / (exposure[name] + s) for name in defence
+        }
+
+        home_exposure = away_exposure = 0.0
+        for (home, away), n in self._pairs.items():
+            home_exposure += n * new_attack[home] * new_defence[away]
+            away_exposure += n * new_attack[away] * new_defence[home]
+        if home_exposure:
+            h = self._home_goals / home_exposure
+        if away_exposure:
+            w = self._away_goals / away_exposure
+
+        # Pin mean attack and defence to 1.0; the goal rates absorb the scale
+        mean_attack = sum(new_attack.values()) / len(new_attack)
+        mean_defence = sum(new_defence.values()) / len(new_defence)
+        h *= mean_attack * mean_defence
+        w *= mean_attack * mean_defence
+
+        change = 0.0
+        for name in attack:
+            a = new_attack[name] / mean_attack
+            d = new_defence[name] / mean_defence
+            change = max(change, abs(a - attack[name]), abs(d - defence[name]))
+            attack[name] = a
+            defence[name] = d
+        self.home_goal_rate, self.away_goal_rate = h, w
+        return change
+
+    def fit(self, max_iterations: int = 200, tol: float = 1e-6) -> int:
+        """
+        Fit strengths to all recorded results, starting from the current values.
+
+        Args:
+            max_iterations: Upper bound on fixed-point iterations
+            tol: Stop once no parameter changes by more than this
+
+        Returns:
+            The number of iterations run
+        """
+        if not self._pairs:
+            return 0
+        for iteration in range(1, max_iterations + 1):
+            if self._iterate() < tol:
+                return iteration
+        return max_iterations
+
+    def update(self, home: str, away: str, home_goals: int, away_goals: int,
+               iterations: int = 5) -> None:
+        """Record a new result and refine the existing fit."""
+        self.add_result(home, away, home_goals, away_goals)
+        self.fit(max_iterations=iterations)
+
+    def update_from_matches(self, matches: Iterable["Match"], iterations: int = 5) -> None:
+        """Record completed matches and refine the existing fit once."""
+        for match in matches:
+            if match.completed:
+                self.add_result(match.home_team.name, match.away_team.name,
+                                match.home_goals, match.away_goals)
+        self.fit(max_iterations=iterations)
+
+    def strengths(self, name: str) -> Optional[Tuple[float, float]]:
+        """Get a team's fitted (attack, defence), or None if it has no results."""
+        if name not in self.attack:
+            return None
+        return self.attack[name], self.defence[name]
+
+    def apply(self, teams: Iterable["Team"], goal_model: Optional[PoissonGoalModel] = None) -> List["Team"]:
+        """
+        Copy fitted strengths onto teams (and base goal rates onto a goal model).
+
+        Args:
+            teams: Teams to update; teams without recorded results are left unchanged
+            goal_model: Optional goal model whose base rates should follow the fit
+
+        Returns:
+            The teams that were updated
+        """
+        updated = []
+        for team in teams:
+            fitted = self.strengths(team.name)
+            if fitted is not None:
+                team.attack, team.defence = fitted
+                updated.append(team)
+        if goal_model is not None:
+            goal_model.home_goal_rate = self.home_goal_rate
+            goal_model.away_goal_rate = self.away_goal_rate
+        return updated
+
+    def goal_model(self, **kwargs) -> PoissonGoalModel:
+        """Create a goal model using the fitted base goal rates."""
+        return PoissonGoalModel(home_goal_rate=self.home_goal_rate,
+                                away_goal_rate=self.away_goal_rate, **kwargs)
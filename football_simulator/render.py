@@ -0,0 +1,158 @@
+"""
+Buffered text rendering for CLI tables and match reports.
+
+Every report is built into a single string and written with one call, so
+terminal output stays cheap over SSH or when piped to a log.
+"""
+from dataclasses import dataclass
+from typing import Iterable, Optional, TextIO
+import io
+import sys
+
+from .models import League, Team, Match
+
+FULL = "full"
+SUMMARY = "summary"
+
+
+@dataclass(frozen=True)
+class Palette:
+    """Escape sequences used for coloured output (empty strings for plain text)."""
+    cyan: str = ""
+    green: str = ""
+    yellow: str = ""
+    red: str = ""
+    reset: str = ""
+
+
+PLAIN = Palette()
+
+
+def color_palette() -> Palette:
+    """Create a palette backed by colorama (imported only when colour is used)."""
+    from colorama import init, Fore, Style
+    init()
+    return Palette(Fore.CYAN, Fore.GREEN, Fore.YELLOW, Fore.RED, Style.RESET_ALL)
+
+
+def palette_for(stream: TextIO, color: Optional[bool] = None) -> Palette:
+    """Pick a palette: coloured for terminals, plain otherwise (unless forced)."""
+    if color is None:
+        color = hasattr(stream, "isatty") and stream.isatty()
+    return color_palette() if color else PLAIN
+
+
+def write(text: str, stream: Optional[TextIO] = None) -> None:
+    """Write a rendered report in one call."""
+    stream = stream or sys.stdout
+    stream.write(text)
+    stream.flush()
+
+
+def render_match_stats(match: Match, pal: Palette = PLAIN) -> str:
+    """Render detailed match statistics."""
+    home, away = match.home_stats, match.away_stats
+    out = io.StringIO()
+    out.write(f"\n{pal.cyan}Match Statistics{pal.reset}\n")
+    out.write(f"{'':20} {pal.green}HOME{pal.reset}  {pal.yellow}AWAY{pal.reset}\n")
+    out.write("-" * 40 + "\n")
+    out.write(f"{'Possession':20} {home.possession:4.1f}%  {away.possession:4.1f}%\n")
+    out.write(f"{'Shots':20} {home.shots:4}  {away.shots:4}\n")
+    out.write(f"{'Shots on Target':20} {home.shots_on_target:4}  {away.shots_on_target:4}\n")
+    out.write(f"{'Corners':20} {home.corners:4}  {away.corners:4}\n")
+    out.write(f"{'Passes':20} {home.passes:4}  {away.passes:4}\n")
+    out.write(f"{'Pass Accuracy':20} {home.pass_accuracy:4.1f}%  {away.pass_accuracy:4.1f}%\n")
+    out.write(f"{'Fouls':20} {home.fouls:4}  {away.fouls:4}\n")
+    out.write(f"{'Yellow Cards':20} {home.yellow_cards:4}  {away.yellow_cards:4}\n")
+    out.write(f"{'Red Cards':20} {home.red_cards:4}  {away.red_cards:4}\n")
+    return out.getvalue()
+
+
+def render_match_summary(match: Match) -> str:
+    """Render a match as a single line."""
+    return f"{match.home_team.name} {match.home_goals} - {match.away_goals} {match.away_team.name}\n"
+
+
+def render_match_result(match: Match, pal: Palette = PLAIN) -> str:
+    """Render a match result with scorers, assists and statistics."""
+    out = io.StringIO()
+    out.write(f"\n{pal.cyan}Match Result:{pal.reset}\n")
+    out.write(f"{pal.green}{match.home_team.name}{pal.reset} {match.home_goals} - "
+              f"{match.away_goals} {pal.yellow}{match.away_team.name}{pal.reset}\n")
+
+    if match.scorers:
+        out.write(f"\n{pal.cyan}Scorers:{pal.reset}\n")
+        for scorer in match.scorers:
+            out.write(f"⚽ {scorer.name}\n")
+
+    if match.assisters:
+        out.write(f"\n{pal.cyan}Assists:{pal.reset}\n")
+        for assister in match.assisters:
+            out.write(f"👟 {assister.name}\n")
+
+    out.write(render_match_stats(match, pal))
+    return out.getvalue()
+
+
+def render_matchday(matches: Iterable[Match], pal: Palette = PLAIN, verbosity: str = FULL) -> str:
+    """Render all results of a matchday at the given verbosity."""
+    if verbosity == SUMMARY:
+        return "".join(render_match_summary(m) for m in matches)
+    return "".join(render_match_result(m, pal) for m in matches)
+
+
+def render_league_table(league: League, pal: Palette = PLAIN) -> str:
+    """Render the league table."""
+    out = io.StringIO()
+    out.write(f"\n{pal.cyan}League Table{pal.reset}\n")
+    out.write(f"{'Pos':4} {'Team':<20} {'P':>3} {'W':>3} {'D':>3} {'L':>3} "
+              f"{'GF':>3} {'GA':>3} {'GD':>4} {'Pts':>4}\n")
+    out.write("-" * 55 + "\n")
+
+    relegation = len(league.teams) - 2
+    for pos, team in enumerate(league.get_league_table(), 1):
+        color = pal.green if pos <= 4 else pal.red if pos >= relegation else pal.reset
+        out.write(f"{color}{pos:2}. {team.name:<20} {team.matches_played:3} {team.wins:3} "
+                  f"{team.draws:3} {team.losses:3} {team.goals_for:3} {team.goals_against:3} "
+                  f"{team.goal_difference:4} {team.points:4}{pal.reset}\n")
+    return out.getvalue()
+
+
+def render_stats(league: League, pal: Palette = PLAIN) -> str:
+    """Render the player leaderboards."""
+    out = io.StringIO()
+    out.write(f"\n{pal.cyan}Top Scorers{pal.reset}\n")
+    for pos, player in enumerate(league.get_top_scorers(), 1):
+        out.write(f"{pos}. {player.name:<20} {player.goals} goals\n")
+
+    out.write(f"\n{pal.cyan}Top Assisters{pal.reset}\n")
+    for pos, player in enumerate(league.get_top_assisters(), 1):
+        out.write(f"{pos}. {player.name:<20} {player.assists} assists\n")
+
+    out.write(f"\n{pal.cyan}Clean Sheets{pal.reset}\n")
+    for pos, player in enumerate(league.get_top_clean_sheets(), 1):
+        out.write(f"{pos}. {player.name:<20} {player.clean_sheets} clean sheets\n")
+
+    out.write(f"\n{pal.cyan}Disciplinary Table{pal.reset}\n")
+    for pos, player in enumerate(league.get_disciplinary_table(), 1):
+        out.write(f"{pos}. {player.name:<20} {player.yellow_cards}🟨 {player.red_cards}🟥\n")
+
+    out.write(f"\n{pal.cyan}Pass Masters (min. 100 passes){pal.reset}\n")
+    for pos, player in enumerate(league.get_pass_masters(), 1):
+        out.write(f"{pos}. {player.name:<20} {player.pass_accuracy:.1f}% "
+                  f"({player.passes_completed}/{player.passes})\n")
+    return out.getvalue()
+
+
+def render_team_stats(team: Team, pal: Palette = PLAIN) -> str:
+    """Render detailed statistics for a team."""
+    out = io.StringIO()
+    out.write(f"\n{pal.cyan}Team Statistics: {team.name}{pal.reset}\n")
+    out.write(f"{'Average Possession':25} {team.average_possession:5.1f}%\n")
+    out.write(f"{'Shot Accuracy':25} {team.shot_accuracy:5.1f}%\n")
+    out.write(f"{'Pass Accuracy':25} {team.pass_accuracy:5.1f}%\n")
+    out.write(f"{'Clean Sheets':25} {team.clean_sheets}\n")
+    out.write(f"{'Yellow Cards':25} {team.yellow_cards}\n")
+    out.write(f"{'Red Cards':25} {team.red_cards}\n")
+    out.write(f"{'Total Fouls':25} {team.fouls}\n")
+    return out.getvalue()
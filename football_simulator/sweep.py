@@ -0,0 +1,190 @@
+"""
+Parameter sweeps over the match engine constants.
+
+Each cell of a sweep simulates one full season for a (parameters, seed) pair.
+Cells run in parallel across processes and finished cells are cached on disk,
+so re-running a sweep only simulates what is new.
+
+Usage:
+    python -m football_simulator.sweep --grid home_conversion=0.25,0.3,0.35 \\
+        --grid away_conversion=0.2,0.25 --seeds 4 --workers 4
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Dict, Iterable, List, Optional, Sequence
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import random
+
+from .models import League, SimulationParams, DEFAULT_PARAMS, create_team
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """Aggregate league metrics for one configuration (averaged over its seeds)."""
+    params: SimulationParams
+    seeds: int
+    matches: int
+    goals_per_game: float
+    home_win_rate: float
+    draw_rate: float
+    away_win_rate: float
+    cards_per_game: float
+
+
+def parameter_grid(base: SimulationParams = DEFAULT_PARAMS, **axes: Sequence) -> List[SimulationParams]:
+    """
+    Build every combination of the given parameter values.
+
+    Args:
+        base: Parameters used for anything not being swept
+        **axes: Parameter name -> values to try
+
+    Returns:
+        One SimulationParams per grid cell
+    """
+    names = list(axes)
+    return [
+        replace(base, **dict(zip(names, values)))
+        for values in itertools.product(*(axes[name] for name in names))
+    ]
+
+
+def _cell_key(params: SimulationParams, seed: int, n_teams: int) -> str:
+    """Stable cache key for a (parameters, seed, league size) cell."""
+    payload = json.dumps({'params': asdict(params), 'seed': seed, 'n_teams': n_teams}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def simulate_cell(params: SimulationParams, seed: int, n_teams: int = 20) -> Dict[str, int]:
+    """Simulate one seeded season and return raw totals."""
+    rng = random.Random(seed)
+    league = League("Sweep League", [create_team(f"Team{i}", rng) for i in range(n_teams)],
+                    seed=seed, params=params)
+    league.generate_fixtures()
+    league.simulate_remaining()
+
+    totals = {'matches': 0, 'goals': 0, 'home_wins': 0, 'draws': 0, 'away_wins': 0, 'cards': 0}
+    for match in league.matches:
+        totals['matches'] += 1
+        totals['goals'] += match.home_goals + match.away_goals
+        if match.home_goals > match.away_goals:
+            totals['home_wins'] += 1
+        elif match.home_goals == match.away_goals:
+            totals['draws'] += 1
+        else:
+            totals['away_wins'] += 1
+        for stats in (match.home_stats, match.away_stats):
+            totals['cards'] += stats.yellow_cards + stats.red_cards
+    return totals
+
+
+def _summarize(params: SimulationParams, cells: List[Dict[str, int]]) -> SweepResult:
+    """Combine the totals of a configuration's cells into rates."""
+    total = {key: sum(cell[key] for cell in cells) for key in cells[0]}
+    n = total['matches'] or 1
+    return SweepResult(
+        params=params,
+        seeds=len(cells),
+        matches=total['matches'],
+        goals_per_game=total['goals'] / n,
+        home_win_rate=total['home_wins'] / n,
+        draw_rate=total['draws'] / n,
+        away_win_rate=total['away_wins'] / n,
+        cards_per_game=total['cards'] / n,
+    )
+
+
+def run_sweep(
+    param_sets: Iterable[SimulationParams],
+    seeds: Iterable[int] = range(4),
+    n_teams: int = 20,
+    workers: Optional[int] = None,
+    cache_dir: Optional[str] = ".sweep_cache",
+) -> List[SweepResult]:
+    """
+    Evaluate parameter sets in parallel, one season per (parameters, seed) cell.
+
+    Args:
+        param_sets: Configurations to evaluate
+        seeds: Seeds to simulate for every configuration
+        n_teams: Teams in each simulated league
+        workers: Worker processes (defaults to the CPU count)
+        cache_dir: Directory for cached cell results, or None to disable caching
+
+    Returns:
+        One SweepResult per configuration, in input order
+    """
+    param_sets = list(param_sets)
+    seeds = list(seeds)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    cells: Dict[str, Dict[str, int]] = {}
+    pending = {}
+    for params in param_sets:
+        for seed in seeds:
+            key = _cell_key(params, seed, n_teams)
+            path = os.path.join(cache_dir, f"{key}.json") if cache_dir else None
+            if path and os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    cells[key] = json.load(f)
+            elif key not in pending:
+                pending[key] = (params, seed)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                key: executor.submit(simulate_cell, params, seed, n_teams)
+                for key, (params, seed) in pending.items()
+            }
+            for key, future in futures.items():
+                cells[key] = future.result()
+                if cache_dir:
+                    with open(os.path.join(cache_dir, f"{key}.json"), 'w', encoding='utf-8') as f:
+                        json.dump(cells[key], f)
+
+    return [
+        _summarize(params, [cells[_cell_key(params, seed, n_teams)] for seed in seeds])
+        for params in param_sets
+    ]
+
+
+def _parse_axis(spec: str) -> tuple:
+    """Parse ``name=v1,v2,...`` into a parameter name and its values."""
+    name, _, values = spec.partition('=')
+    if name not in {f.name for f in fields(SimulationParams)} or not values:
+        raise argparse.ArgumentTypeError(f"expected <parameter>=<v1>,<v2>,... got {spec!r}")
+    default = getattr(DEFAULT_PARAMS, name)
+    if isinstance(default, tuple):
+        # Range and (mean, sd) parameters take colon-separated pairs, e.g. 0.3:0.6
+        return name, [tuple(float(x) for x in v.split(':')) for v in values.split(',')]
+    return name, [type(default)(v) for v in values.split(',')]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Sweep match engine parameters")
+    parser.add_argument("--grid", type=_parse_axis, action="append", default=[],
+                        metavar="NAME=V1,V2", help="parameter values to sweep (repeatable)")
+    parser.add_argument("--seeds", type=int, default=4, help="seasons per configuration")
+    parser.add_argument("--teams", type=int, default=20, help="teams per league")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    parser.add_argument("--cache-dir", default=".sweep_cache", help="cell result cache ('' to disable)")
+    args = parser.parse_args(argv)
+
+    axes = dict(args.grid)
+    results = run_sweep(parameter_grid(**axes), range(args.seeds), args.teams,
+                        args.workers, args.cache_dir or None)
+
+    print(f"{'configuration':<40} {'goals':>6} {'home':>6} {'draw':>6} {'away':>6} {'cards':>6}")
+    for result in results:
+        label = ", ".join(f"{name}={getattr(result.params, name)}" for name in axes) or "defaults"
+        print(f"{label:<40} {result.goals_per_game:6.2f} {result.home_win_rate:6.1%} "
+              f"{result.draw_rate:6.1%} {result.away_win_rate:6.1%} {result.cards_per_game:6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import random
+
+from football_simulator.cache import VIEW_CACHE, ViewCache
+from football_simulator.models import League, create_team
+
+
+def _league(n_teams: int = 4) -> League:
+    rng = random.Random(4)
+    league = League("Test League", [create_team(f"T{i}", rng) for i in range(n_teams)], seed=4)
+    league.generate_fixtures()
+    return league
+
+
+class _Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.calls
+
+
+def test_repeated_reads_are_cached():
+    cache, league, compute = ViewCache(), _league(), _Counter()
+    assert cache.get(league, "table", compute) == cache.get(league, "table", compute) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_simulating_a_matchday_invalidates():
+    cache, league, compute = ViewCache(), _league(), _Counter()
+    cache.get(league, "table", compute)
+    league.simulate_matchday()
+    assert cache.get(league, "table", compute) == 2
+
+
+def test_simulate_matchday_clears_shared_cache():
+    league = _league()
+    VIEW_CACHE.get(league, "table", lambda: "before")
+    league.simulate_matchday()
+    assert league.token not in VIEW_CACHE._leagues
+
+
+def test_first_snapshot_keeps_cached_views():
+    league, compute = _league(), _Counter()
+    league.simulate_matchday()
+    VIEW_CACHE.get(league, "table", compute)
+    version = league.version
+    league.snapshot()
+    assert league.version == version
+    assert VIEW_CACHE.get(league, "table", compute) == 1
+
+
+def test_publish_invalidates():
+    cache, league, compute = ViewCache(), _league(), _Counter()
+    cache.get(league, "table", compute)
+    league.teams[0].points += 3
+    league.publish()
+    assert cache.get(league, "table", compute) == 2
+
+
+def test_least_recently_used_league_is_evicted():
+    cache = ViewCache(max_leagues=2)
+    first, second, third = _league(), _league(), _league()
+    compute = _Counter()
+    cache.get(first, "table", compute)
+    cache.get(second, "table", compute)
+    cache.get(first, "table", compute)  # first is now the most recently used
+    cache.get(third, "table", compute)
+
+    assert cache.get(first, "table", compute) == 1
+    assert cache.get(second, "table", compute) == 4
+
+
+def test_forks_and_copies_do_not_share_views():
+    cache, league = ViewCache(), _league()
+    cache.get(league, "table", lambda: "parent")
+    assert cache.get(league.fork(), "table", lambda: "branch") == "branch"
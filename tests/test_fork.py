@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from football_simulator.goal_models import PoissonGoalModel
+from football_simulator.models import League, create_team
+from football_simulator.persistence import load_league, save_league
+from football_simulator.ratings import RatingModel
+
+
+def _league(n_teams: int = 6, lazy: bool = False, **kwargs) -> League:
+    rng = random.Random(11)
+    league = League("Test League", [create_team(f"T{i}", rng) for i in range(n_teams)], seed=11, **kwargs)
+    league.generate_fixtures(lazy=lazy)
+    return league
+
+
+@pytest.mark.parametrize("lazy_schedule", [False, True])
+@pytest.mark.parametrize("history", ["full", "seed"])
+def test_fork_of_lazily_loaded_save(tmp_path, lazy_schedule, history):
+    league = _league(lazy=lazy_schedule, history=history)
+    league.simulate_matchday()
+    loaded = load_league(save_league(league, str(tmp_path)), lazy=True)
+
+    branch = loaded.fork()
+    played = branch.get_matchday_fixtures(1)
+    assert all(match.completed for match in played)
+    assert [m.home_goals for m in played] == [m.home_goals for m in league.get_matchday_fixtures(1)]
+    assert branch.simulate_matchday()
+    assert branch.matches[0].completed
+
+
+def test_fork_is_isolated_from_parent():
+    league = _league(goal_model=PoissonGoalModel(), rating_model=RatingModel())
+    league.simulate_matchday()
+    branch = league.fork()
+    rates = (branch.goal_model.home_goal_rate, branch.goal_model.away_goal_rate)
+    points = {team.name: team.points for team in branch.teams}
+
+    league.simulate_matchday()
+
+    assert (branch.goal_model.home_goal_rate, branch.goal_model.away_goal_rate) == rates
+    assert {team.name: team.points for team in branch.teams} == points
+    assert branch.current_matchday == 1
+    assert not branch.matches[3].completed
+
+
+def test_unpinned_fork_plays_like_parent():
+    league = _league()
+    league.simulate_matchday()
+    branch = league.fork()
+    branch.simulate_remaining()
+    league.simulate_remaining()
+    assert [t.points for t in branch.teams] == [t.points for t in league.teams]
+
+
+def test_pinned_result_is_played_on_branch_only():
+    league = _league()
+    league.simulate_matchday()
+    branch = league.fork()
+    index = branch.remaining_fixtures("T0")[0]
+    branch.pin_result(index, 7, 0)
+    branch.simulate_remaining()
+    league.simulate_remaining()
+
+    assert (branch.matches[index].home_goals, branch.matches[index].away_goals) == (7, 0)
+    assert (league.matches[index].home_goals, league.matches[index].away_goals) != (7, 0)
+
+
+@pytest.mark.parametrize("index, home_goals, away_goals, error", [
+    (0, 1, 0, ValueError),     # already played
+    (-1, 1, 0, IndexError),
+    (30, 1, 0, IndexError),
+    (5, -2, 0, ValueError),
+    (5, 1, 1.5, ValueError),
+    (5, True, 0, ValueError),
+])
+def test_pin_result_rejects_invalid_pins(index, home_goals, away_goals, error):
+    league = _league()
+    league.simulate_matchday()
+    with pytest.raises(error):
+        league.pin_result(index, home_goals, away_goals)
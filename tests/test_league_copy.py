@@ -0,0 +1,42 @@
+import copy
+import pickle
+import random
+
+import pytest
+
+from football_simulator.models import League, create_team
+from football_simulator.persistence import load_league, save_league
+
+
+def _league(**kwargs) -> League:
+    rng = random.Random(3)
+    league = League("Test League", [create_team(f"T{i}", rng) for i in range(6)], seed=3, **kwargs)
+    league.generate_fixtures()
+    league.simulate_matchday()
+    return league
+
+
+def _points(league: League) -> list:
+    return [team.points for team in league.teams]
+
+
+@pytest.mark.parametrize("history", ["full", "seed"])
+def test_copy_without_snapshot(history):
+    league = _league(history=history)
+    for clone in (copy.deepcopy(league), pickle.loads(pickle.dumps(league))):
+        assert clone.token != league.token
+        assert clone.teams[0] is not league.teams[0]
+        clone.simulate_matchday()
+        assert clone.snapshot().version == clone.version
+
+    league.simulate_matchday()
+    assert _points(clone) == _points(league)
+
+
+
+def test_copy_of_lazily_loaded_league(tmp_path):
+    league = load_league(save_league(_league(), str(tmp_path)), lazy=True)
+    for clone in (copy.deepcopy(league), pickle.loads(pickle.dumps(league))):
+        clone.simulate_matchday()
+    league.simulate_matchday()
+    assert _points(clone) == _points(league)
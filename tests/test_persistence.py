@@ -0,0 +1,80 @@
+import os
+import random
+
+import pytest
+
+from football_simulator.models import League, create_team
+from football_simulator.persistence import (
+    get_latest_save, list_saves, load_league, save_league
+)
+
+
+def _league(**kwargs) -> League:
+    rng = random.Random(2)
+    league = League("Test League", [create_team(f"T{i}", rng) for i in range(6)], seed=2, **kwargs)
+    league.generate_fixtures()
+    league.simulate_matchday()
+    return league
+
+
+def test_back_to_back_saves_do_not_overwrite(tmp_path):
+    league = _league()
+    paths = [save_league(league, str(tmp_path)) for _ in range(3)]
+    assert len(set(paths)) == 3
+    assert sorted(list_saves(str(tmp_path))) == sorted(paths)
+    assert get_latest_save(str(tmp_path)) == paths[-1]
+    for path in paths:
+        assert load_league(path).current_matchday == 1
+
+
+def _summary(league: League) -> list:
+    return [(m.home_team.name, m.away_team.name, m.completed, m.home_goals, m.away_goals,
+             [p.name for p in m.scorers]) for m in league.matches]
+
+
+@pytest.mark.parametrize("history", ["full", "seed"])
+def test_lazy_load_matches_eager_load(tmp_path, history):
+    league = _league(history=history)
+    path = save_league(league, str(tmp_path))
+    eager = load_league(path)
+    lazy = load_league(path, lazy=True)
+
+    assert [t.points for t in lazy.get_league_table()] == [t.points for t in league.get_league_table()]
+    assert not lazy.matches.is_hydrated(0)
+    assert _summary(lazy) == _summary(eager) == _summary(league)
+
+
+def test_lazy_league_saves_unchanged(tmp_path):
+    path = save_league(_league(), str(tmp_path / "first"))
+    resaved = save_league(load_league(path, lazy=True), str(tmp_path / "second"))
+    with open(path, encoding='utf-8') as first, open(resaved, encoding='utf-8') as second:
+        assert first.read() == second.read()
+
+
+def test_lazy_league_keeps_simulating(tmp_path):
+    league = _league()
+    lazy = load_league(save_league(league, str(tmp_path)), lazy=True)
+    lazy.simulate_remaining()
+    assert all(m.completed for m in lazy.matches)
+    assert sum(t.matches_played for t in lazy.teams) == 2 * len(lazy.matches)
+
+
+@pytest.mark.parametrize("compression, magic", [("gzip", b"\x1f\x8b"), ("xz", b"\xfd7zXZ\x00")])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_compressed_round_trip(tmp_path, compression, magic, lazy):
+    league = _league()
+    path = save_league(league, str(tmp_path), compression=compression)
+    with open(path, 'rb') as f:
+        assert f.read(len(magic)) == magic
+
+    # Detection uses the magic bytes, not the file name
+    renamed = os.path.join(str(tmp_path), "league_save_renamed.json")
+    os.rename(path, renamed)
+    loaded = load_league(renamed, lazy=lazy)
+    assert _summary(loaded) == _summary(league)
+    assert renamed in list_saves(str(tmp_path))
+
+
+def test_unknown_compression_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        save_league(_league(), str(tmp_path), compression="rar")
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from football_simulator import projection
+from football_simulator.models import League, create_team
+from football_simulator.projection import _count_ahead, project_league
+
+
+def _league(n_teams: int) -> League:
+    rng = random.Random(5)
+    league = League("Test League", [create_team(f"T{i}", rng) for i in range(n_teams)], seed=5)
+    league.generate_fixtures(lazy=True)
+    league.simulate_matchday()
+    return league
+
+
+def _brute_force_positions(league: League, projections) -> dict:
+    """Position probabilities with one Poisson-binomial per (team, points total)."""
+    dists = {p.team.name: (p.team.points, p.points_distribution) for p in projections}
+
+    def above(name: str, pts: int) -> float:
+        base, dist = dists[name]
+        return sum(p for i, p in enumerate(dist) if base + i > pts) + \
+            0.5 * sum(p for i, p in enumerate(dist) if base + i == pts)
+
+    result = {}
+    for name, (base, dist) in dists.items():
+        positions = [0.0] * len(dists)
+        for idx, p in enumerate(dist):
+            if p < 1e-12:
+                continue
+            ahead = _count_ahead([above(other, base + idx) for other in dists if other != name])
+            for k, q in enumerate(ahead):
+                positions[k] += p * q
+        result[name] = positions
+    return result
+
+
+def test_exact_positions_match_brute_force():
+    league = _league(6)
+    projections = project_league(league)
+    expected = _brute_force_positions(league, projections)
+    for proj in projections:
+        assert sum(proj.position_probabilities) == pytest.approx(1.0)
+        assert proj.position_probabilities == pytest.approx(expected[proj.team.name], abs=1e-9)
+
+
+def test_approximate_positions_are_close_to_exact(monkeypatch):
+    league = _league(12)
+    exact = {p.team.name: p.expected_position for p in project_league(league)}
+    monkeypatch.setattr(projection, "EXACT_POSITIONS_MAX_TEAMS", 0)
+    for proj in project_league(league):
+        assert sum(proj.position_probabilities) == pytest.approx(1.0)
+        assert proj.expected_position == pytest.approx(exact[proj.team.name], abs=1.5)
@@ -0,0 +1,28 @@
+import random
+
+from football_simulator.models import League, create_team
+
+
+def _season() -> list:
+    league = League("Test League", [create_team(f"T{i}") for i in range(6)])
+    league.generate_fixtures()
+    league.simulate_remaining()
+    return [(m.home_team.name, m.away_team.name, m.home_goals, m.away_goals) for m in league.matches]
+
+
+def test_global_seed_reproduces_unseeded_league():
+    random.seed(42)
+    first = _season()
+    random.seed(42)
+    assert _season() == first
+
+
+def test_explicit_seed_reproduces_league():
+    def season(seed: int) -> list:
+        rng = random.Random(seed)
+        league = League("Test League", [create_team(f"T{i}", rng) for i in range(6)], seed=seed)
+        league.generate_fixtures()
+        league.simulate_remaining()
+        return [(m.home_goals, m.away_goals) for m in league.matches]
+
+    assert season(9) == season(9)
@@ -0,0 +1,65 @@
+import random
+from collections import Counter
+
+import pytest
+
+from football_simulator.models import FixtureSchedule, League, create_team
+from football_simulator.persistence import load_league, save_league
+
+
+def _teams(n_teams: int) -> list:
+    rng = random.Random(n_teams)
+    return [create_team(f"T{i}", rng) for i in range(n_teams)]
+
+
+@pytest.mark.parametrize("n_teams", [2, 3, 4, 7, 10, 21])
+def test_every_pair_meets_once_per_leg(n_teams):
+    schedule = FixtureSchedule(_teams(n_teams))
+    pairings = [schedule.pairing(i) for i in range(len(schedule))]
+    half = len(pairings) // 2
+
+    assert len(pairings) == n_teams * (n_teams - 1)
+    assert len(set(pairings)) == len(pairings)  # each ordered pair, i.e. home and away, once
+    for leg in (pairings[:half], pairings[half:]):
+        assert len({frozenset(pair) for pair in leg}) == len(leg)
+    assert Counter(home for home, _ in pairings) == Counter({t: n_teams - 1 for t in range(n_teams)})
+
+
+@pytest.mark.parametrize("n_teams", [4, 7, 10])
+def test_one_fixture_per_team_per_matchday(n_teams):
+    schedule = FixtureSchedule(_teams(n_teams))
+    for matchday in range(1, len(schedule) // schedule.per_day + 1):
+        names = [team.name for pair in schedule.matchday(matchday) for team in pair]
+        assert len(names) == len(set(names)) == 2 * schedule.per_day
+
+
+def test_schedule_stores_only_kept_matches():
+    league = League("Test League", _teams(8), seed=1, history="none")
+    league.generate_fixtures(lazy=True)
+    league.simulate_matchday()
+    assert league.matches.played() == {}
+    assert sum(t.matches_played for t in league.teams) == 8
+    assert not league.matches[0].completed
+
+
+@pytest.mark.parametrize("history", ["full", "seed"])
+def test_schedule_save_round_trip(tmp_path, history):
+    league = League("Test League", _teams(9), seed=1, history=history)
+    league.generate_fixtures(lazy=True)
+    league.simulate_matchday()
+    loaded = load_league(save_league(league, str(tmp_path)))
+
+    assert isinstance(loaded.matches, FixtureSchedule)
+    assert loaded.matches.order == league.matches.order
+    assert [(m.home_goals, m.away_goals) for m in loaded.get_matchday_fixtures(1)] == \
+        [(m.home_goals, m.away_goals) for m in league.get_matchday_fixtures(1)]
+    loaded.simulate_remaining()
+    assert all(t.matches_played == 16 for t in loaded.teams)
+
+
+def test_history_none_on_fixture_list_keeps_no_matches():
+    league = League("Test League", _teams(6), seed=1, history="none")
+    league.generate_fixtures()
+    league.simulate_remaining()
+    assert not any(m.completed for m in league.matches)
+    assert sum(t.matches_played for t in league.teams) == 2 * len(league.matches)
@@ -0,0 +1,26 @@
+import random
+
+from football_simulator.goal_models import PoissonGoalModel
+from football_simulator.models import League, MatchRecord, create_team
+from football_simulator.ratings import RatingModel
+
+
+def _league(**kwargs) -> League:
+    rng = random.Random(7)
+    league = League("Test League", [create_team(f"T{i}", rng) for i in range(6)], seed=7, **kwargs)
+    league.generate_fixtures()
+    return league
+
+
+def test_seed_history_replays_with_refitted_goal_model():
+    league = _league(history="seed", goal_model=PoissonGoalModel(), rating_model=RatingModel())
+    played = [list(league.simulate_matchday()) for _ in range(3)]
+    assert (league.goal_model.home_goal_rate, league.goal_model.away_goal_rate) != (1.5, 1.15)
+
+    for matchday, matches in enumerate(played):
+        for i, original in enumerate(matches):
+            index = matchday * 3 + i
+            record = league.matches.entries()[index]
+            assert isinstance(record, MatchRecord)
+            replayed = league.matches[index]
+            assert replayed.result_digest() == original.result_digest()